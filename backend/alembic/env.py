@@ -1,12 +1,10 @@
 """
 Alembic environment configuration.
 """
-import asyncio
 from logging.config import fileConfig
 
-from sqlalchemy import pool
+from sqlalchemy import create_engine, pool
 from sqlalchemy.engine import Connection
-from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from alembic import context
 
@@ -83,10 +81,14 @@ def do_run_migrations(connection: Connection) -> None:
         context.run_migrations()
 
 
-async def run_async_migrations() -> None:
-    """Run migrations in async mode."""
-    # Use sync engine for migrations (Alembic works better with sync)
-    from sqlalchemy import create_engine
+def run_migrations_online() -> None:
+    """Run migrations in 'online' mode.
+
+    Uses a sync psycopg2 engine (Alembic works better with sync). Every
+    revision runs on the one connection opened here, so NullPool costs a
+    single handshake per migration run; multi-statement DDL is batched inside
+    the revisions themselves.
+    """
     url = config.get_main_option("sqlalchemy.url")
     sync_engine = create_engine(url, poolclass=pool.NullPool)
 
@@ -96,11 +98,6 @@ async def run_async_migrations() -> None:
     sync_engine.dispose()
 
 
-def run_migrations_online() -> None:
-    """Run migrations in 'online' mode."""
-    asyncio.run(run_async_migrations())
-
-
 if context.is_offline_mode():
     run_migrations_offline()
 else:
@@ -16,6 +16,38 @@ down_revision = None
 branch_labels = None
 depends_on = None
 
+# Index DDL, issued as a single batch once all tables exist
+INITIAL_INDEXES = (
+    "CREATE UNIQUE INDEX ix_users_email ON users (email)",
+    "CREATE INDEX ix_users_created_at ON users (created_at)",
+    "CREATE INDEX ix_families_owner_id ON families (owner_id)",
+    "CREATE INDEX ix_families_created_at ON families (created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_families_location ON families USING gist (location)",
+    "CREATE INDEX ix_providers_name ON providers (name)",
+    "CREATE INDEX ix_providers_created_at ON providers (created_at)",
+    "CREATE INDEX ix_venues_geohash ON venues (geohash)",
+    "CREATE INDEX ix_venues_created_at ON venues (created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_venues_location ON venues USING gist (location)",
+    "CREATE INDEX ix_child_profiles_family_id ON child_profiles (family_id)",
+    "CREATE INDEX ix_child_profiles_created_at ON child_profiles (created_at)",
+    "CREATE INDEX idx_child_profiles_temperament ON child_profiles USING gin (temperament)",
+    "CREATE INDEX ix_activities_provider_id ON activities (provider_id)",
+    "CREATE INDEX ix_activities_venue_id ON activities (venue_id)",
+    "CREATE INDEX ix_activities_name ON activities (name)",
+    "CREATE INDEX ix_activities_start_date ON activities (start_date)",
+    "CREATE INDEX ix_activities_created_at ON activities (created_at)",
+    "CREATE INDEX idx_activities_attributes ON activities USING gin (attributes)",
+    "CREATE INDEX ix_recommendations_family_id ON recommendations (family_id)",
+    "CREATE INDEX ix_recommendations_child_profile_id ON recommendations (child_profile_id)",
+    "CREATE INDEX ix_recommendations_activity_id ON recommendations (activity_id)",
+    "CREATE INDEX ix_recommendations_total_score ON recommendations (total_score)",
+    "CREATE INDEX ix_recommendations_tier ON recommendations (tier)",
+    "CREATE INDEX ix_recommendations_created_at ON recommendations (created_at)",
+    "CREATE INDEX ix_scraper_logs_provider_id ON scraper_logs (provider_id)",
+    "CREATE INDEX ix_scraper_logs_run_started_at ON scraper_logs (run_started_at)",
+    "CREATE INDEX ix_scraper_logs_created_at ON scraper_logs (created_at)",
+)
+
 
 def upgrade() -> None:
     # Enable PostGIS extension (if available)
@@ -37,8 +69,6 @@ def upgrade() -> None:
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
-    op.create_index(op.f('ix_users_created_at'), 'users', ['created_at'], unique=False)
 
     # Create families table
     op.create_table(
@@ -59,9 +89,6 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['owner_id'], ['users.id'], ondelete='CASCADE'),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_families_owner_id'), 'families', ['owner_id'], unique=False)
-    op.create_index(op.f('ix_families_created_at'), 'families', ['created_at'], unique=False)
-    op.execute("CREATE INDEX IF NOT EXISTS idx_families_location ON families USING gist (location)")
 
     # Create providers table
     op.create_table(
@@ -80,8 +107,6 @@ def upgrade() -> None:
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_providers_name'), 'providers', ['name'], unique=False)
-    op.create_index(op.f('ix_providers_created_at'), 'providers', ['created_at'], unique=False)
 
     # Create venues table
     op.create_table(
@@ -104,9 +129,6 @@ def upgrade() -> None:
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_venues_geohash'), 'venues', ['geohash'], unique=False)
-    op.create_index(op.f('ix_venues_created_at'), 'venues', ['created_at'], unique=False)
-    op.execute("CREATE INDEX IF NOT EXISTS idx_venues_location ON venues USING gist (location)")
 
     # Create child_profiles table
     op.create_table(
@@ -129,9 +151,6 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['family_id'], ['families.id'], ondelete='CASCADE'),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_child_profiles_family_id'), 'child_profiles', ['family_id'], unique=False)
-    op.create_index(op.f('ix_child_profiles_created_at'), 'child_profiles', ['created_at'], unique=False)
-    op.create_index('idx_child_profiles_temperament', 'child_profiles', ['temperament'], postgresql_using='gin', unique=False)
 
     # Create activities table
     op.create_table(
@@ -170,13 +189,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id'),
         sa.UniqueConstraint('canon_hash')
     )
-    op.create_index(op.f('ix_activities_provider_id'), 'activities', ['provider_id'], unique=False)
-    op.create_index(op.f('ix_activities_venue_id'), 'activities', ['venue_id'], unique=False)
-    op.create_index(op.f('ix_activities_name'), 'activities', ['name'], unique=False)
-    op.create_index(op.f('ix_activities_start_date'), 'activities', ['start_date'], unique=False)
-    op.create_index(op.f('ix_activities_canon_hash'), 'activities', ['canon_hash'], unique=False)
-    op.create_index(op.f('ix_activities_created_at'), 'activities', ['created_at'], unique=False)
-    op.create_index('idx_activities_attributes', 'activities', ['attributes'], postgresql_using='gin', unique=False)
 
     # Create recommendations table
     op.create_table(
@@ -203,12 +215,6 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['activity_id'], ['activities.id'], ondelete='CASCADE'),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_recommendations_family_id'), 'recommendations', ['family_id'], unique=False)
-    op.create_index(op.f('ix_recommendations_child_profile_id'), 'recommendations', ['child_profile_id'], unique=False)
-    op.create_index(op.f('ix_recommendations_activity_id'), 'recommendations', ['activity_id'], unique=False)
-    op.create_index(op.f('ix_recommendations_total_score'), 'recommendations', ['total_score'], unique=False)
-    op.create_index(op.f('ix_recommendations_tier'), 'recommendations', ['tier'], unique=False)
-    op.create_index(op.f('ix_recommendations_created_at'), 'recommendations', ['created_at'], unique=False)
 
     # Create scraper_logs table
     op.create_table(
@@ -234,19 +240,15 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['provider_id'], ['providers.id'], ondelete='CASCADE'),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_scraper_logs_provider_id'), 'scraper_logs', ['provider_id'], unique=False)
-    op.create_index(op.f('ix_scraper_logs_run_started_at'), 'scraper_logs', ['run_started_at'], unique=False)
-    op.create_index(op.f('ix_scraper_logs_created_at'), 'scraper_logs', ['created_at'], unique=False)
+
+    # Create all indexes in one round-trip instead of one per statement
+    op.execute(";\n".join(INITIAL_INDEXES))
 
 
 def downgrade() -> None:
-    op.drop_table('scraper_logs')
-    op.drop_table('recommendations')
-    op.drop_table('activities')
-    op.drop_table('child_profiles')
-    op.drop_table('venues')
-    op.drop_table('providers')
-    op.drop_table('families')
-    op.drop_table('users')
+    # One multi-target DROP instead of a round-trip per table
+    op.execute(
+        'DROP TABLE IF EXISTS scraper_logs, recommendations, activities, '
+        'child_profiles, venues, providers, families, users CASCADE'
+    )
     op.execute('DROP EXTENSION IF EXISTS postgis')
-
@@ -0,0 +1,23 @@
+"""Add (is_active, id) index for keyset pagination of activities
+
+Revision ID: 002_activities_keyset_index
+Revises: 001_initial
+Create Date: 2026-10-15 09:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '002_activities_keyset_index'
+down_revision = '001_initial'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Supports WHERE is_active = ? AND id > ? ORDER BY id LIMIT n
+    op.create_index('idx_activities_active_id', 'activities', ['is_active', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_activities_active_id', table_name='activities')
@@ -0,0 +1,30 @@
+"""Add partial composite index for list_activities filters
+
+Revision ID: 003_activities_filter_index
+Revises: 002_activities_keyset_index
+Create Date: 2026-10-15 09:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '003_activities_filter_index'
+down_revision = '002_activities_keyset_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Covers activity_type + age range filters on the default is_active = true path
+    op.create_index(
+        'idx_activities_active_type_age',
+        'activities',
+        ['activity_type', 'min_age', 'max_age'],
+        unique=False,
+        postgresql_where=sa.text('is_active = true'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_activities_active_type_age', table_name='activities')
@@ -0,0 +1,32 @@
+"""Enforce case-insensitive email uniqueness with a lower(email) index
+
+Revision ID: 005_users_email_lower_unique
+Revises: 004_location_spgist_indexes
+Create Date: 2026-10-15 10:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '005_users_email_lower_unique'
+down_revision = '004_location_spgist_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Fails if case-variant duplicates already exist - resolve those first
+    op.create_index(
+        'ix_users_email_lower',
+        'users',
+        [sa.text('lower(email)')],
+        unique=True,
+    )
+    # Lookups now go through lower(email); the raw-email index is redundant
+    op.drop_index('ix_users_email', table_name='users')
+
+
+def downgrade() -> None:
+    op.create_index('ix_users_email', 'users', ['email'], unique=True)
+    op.drop_index('ix_users_email_lower', table_name='users')
@@ -0,0 +1,44 @@
+"""Replace B-tree created_at indexes with BRIN
+
+Revision ID: 006_created_at_brin_indexes
+Revises: 005_users_email_lower_unique
+Create Date: 2026-10-15 11:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '006_created_at_brin_indexes'
+down_revision = '005_users_email_lower_unique'
+branch_labels = None
+depends_on = None
+
+# Every table using TimestampMixin
+TABLES = (
+    'users',
+    'families',
+    'providers',
+    'venues',
+    'child_profiles',
+    'activities',
+    'recommendations',
+    'scraper_logs',
+)
+
+
+def upgrade() -> None:
+    # created_at grows with insertion order, the ideal case for BRIN
+    op.execute(";\n".join(
+        f"DROP INDEX IF EXISTS ix_{table}_created_at;\n"
+        f"CREATE INDEX ix_{table}_created_at ON {table} "
+        f"USING brin (created_at) WITH (pages_per_range = 32)"
+        for table in TABLES
+    ))
+
+
+def downgrade() -> None:
+    op.execute(";\n".join(
+        f"DROP INDEX IF EXISTS ix_{table}_created_at;\n"
+        f"CREATE INDEX ix_{table}_created_at ON {table} (created_at)"
+        for table in TABLES
+    ))
@@ -0,0 +1,23 @@
+"""Drop redundant ix_activities_canon_hash
+
+Revision ID: 007_drop_activities_canon_hash_index
+Revises: 006_created_at_brin_indexes
+Create Date: 2026-10-15 11:30:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '007_drop_activities_canon_hash_index'
+down_revision = '006_created_at_brin_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The UNIQUE (canon_hash) constraint already provides a B-tree index
+    op.execute("DROP INDEX IF EXISTS ix_activities_canon_hash")
+
+
+def downgrade() -> None:
+    op.create_index('ix_activities_canon_hash', 'activities', ['canon_hash'], unique=False)
@@ -0,0 +1,46 @@
+"""Add partial child_profiles family index and recommendation score index
+
+Revision ID: 008_child_and_recommendation_indexes
+Revises: 007_drop_activities_canon_hash_index
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '008_child_and_recommendation_indexes'
+down_revision = '007_drop_activities_canon_hash_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Every children query filters on family_id AND deleted_at IS NULL
+    op.create_index(
+        'idx_child_profiles_family_active',
+        'child_profiles',
+        ['family_id'],
+        unique=False,
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+    # Serves WHERE child_profile_id = ? ORDER BY total_score DESC without a sort;
+    # supersedes the single-column child_profile_id index
+    op.create_index(
+        'idx_recommendations_child_score',
+        'recommendations',
+        ['child_profile_id', sa.text('total_score DESC')],
+        unique=False,
+    )
+    op.execute("DROP INDEX IF EXISTS ix_recommendations_child_profile_id")
+
+
+def downgrade() -> None:
+    op.create_index(
+        'ix_recommendations_child_profile_id',
+        'recommendations',
+        ['child_profile_id'],
+        unique=False,
+    )
+    op.drop_index('idx_recommendations_child_score', table_name='recommendations')
+    op.drop_index('idx_child_profiles_family_active', table_name='child_profiles')
@@ -0,0 +1,37 @@
+"""Store recommendation scores as SMALLINT hundredths
+
+Revision ID: 009_recommendation_scores_smallint
+Revises: 008_child_and_recommendation_indexes
+Create Date: 2026-10-15 12:30:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '009_recommendation_scores_smallint'
+down_revision = '008_child_and_recommendation_indexes'
+branch_labels = None
+depends_on = None
+
+SCORE_COLUMNS = ('total_score', 'fit_score', 'practical_score', 'goals_score')
+
+
+def upgrade() -> None:
+    # NUMERIC(5,2) 0-100 -> SMALLINT 0-10000 (see ScaledScore); one table rewrite
+    op.execute(
+        "ALTER TABLE recommendations "
+        + ", ".join(
+            f"ALTER COLUMN {column} TYPE smallint USING round({column} * 100)::smallint"
+            for column in SCORE_COLUMNS
+        )
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE recommendations "
+        + ", ".join(
+            f"ALTER COLUMN {column} TYPE numeric(5, 2) USING {column} / 100.0"
+            for column in SCORE_COLUMNS
+        )
+    )
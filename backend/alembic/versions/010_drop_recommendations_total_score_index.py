@@ -0,0 +1,24 @@
+"""Drop standalone ix_recommendations_total_score
+
+Revision ID: 010_drop_recommendations_total_score_index
+Revises: 009_recommendation_scores_smallint
+Create Date: 2026-10-15 13:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '010_drop_recommendations_total_score_index'
+down_revision = '009_recommendation_scores_smallint'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Scores are only ever ordered within a child, which
+    # idx_recommendations_child_score (child_profile_id, total_score DESC) serves
+    op.execute("DROP INDEX IF EXISTS ix_recommendations_total_score")
+
+
+def downgrade() -> None:
+    op.create_index('ix_recommendations_total_score', 'recommendations', ['total_score'], unique=False)
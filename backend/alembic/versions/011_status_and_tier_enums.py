@@ -0,0 +1,39 @@
+"""Store registration_status and recommendation tier as native enums
+
+Revision ID: 011_status_and_tier_enums
+Revises: 010_drop_recommendations_total_score_index
+Create Date: 2026-10-15 14:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '011_status_and_tier_enums'
+down_revision = '010_drop_recommendations_total_score_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 4-byte enum OIDs instead of varchar/text; existing indexes are rebuilt
+    # by the type change. Fails if a row holds a value outside the set.
+    op.execute("CREATE TYPE registration_status AS ENUM ('open', 'closed', 'waitlist', 'full')")
+    op.execute(
+        "ALTER TABLE activities ALTER COLUMN registration_status "
+        "TYPE registration_status USING registration_status::registration_status"
+    )
+    op.execute("CREATE TYPE recommendation_tier AS ENUM ('primary', 'budget_saver', 'stretch')")
+    op.execute(
+        "ALTER TABLE recommendations ALTER COLUMN tier "
+        "TYPE recommendation_tier USING tier::recommendation_tier"
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE recommendations ALTER COLUMN tier TYPE text USING tier::text")
+    op.execute("DROP TYPE recommendation_tier")
+    op.execute(
+        "ALTER TABLE activities ALTER COLUMN registration_status "
+        "TYPE varchar(20) USING registration_status::text"
+    )
+    op.execute("DROP TYPE registration_status")
@@ -0,0 +1,30 @@
+"""Index scraper_logs by provider and latest run
+
+Revision ID: 013_scraper_logs_provider_run_index
+Revises: 012_cluster_venues_by_geohash
+Create Date: 2026-10-15 15:30:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '013_scraper_logs_provider_run_index'
+down_revision = '012_cluster_venues_by_geohash'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves ScraperLog.providers_to_demote (latest runs per provider) and,
+    # with provider_id leading, the foreign key - the single-column index
+    # becomes redundant
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_scraper_logs_provider_run "
+        "ON scraper_logs (provider_id, run_started_at DESC)"
+    )
+    op.execute("DROP INDEX IF EXISTS ix_scraper_logs_provider_id")
+
+
+def downgrade() -> None:
+    op.execute("CREATE INDEX IF NOT EXISTS ix_scraper_logs_provider_id ON scraper_logs (provider_id)")
+    op.execute("DROP INDEX IF EXISTS idx_scraper_logs_provider_run")
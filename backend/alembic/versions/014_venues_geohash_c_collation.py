@@ -0,0 +1,26 @@
+"""Use "C" collation for venues.geohash
+
+Revision ID: 014_venues_geohash_c_collation
+Revises: 013_scraper_logs_provider_run_index
+Create Date: 2026-10-15 16:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '014_venues_geohash_c_collation'
+down_revision = '013_scraper_logs_provider_run_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Byte-wise ordering makes geohash prefix ranges index range scans. The
+    # type change rebuilds ix_venues_geohash; re-mark it as the cluster index.
+    op.execute('ALTER TABLE venues ALTER COLUMN geohash TYPE varchar(12) COLLATE "C"')
+    op.execute("ALTER TABLE venues CLUSTER ON ix_venues_geohash")
+
+
+def downgrade() -> None:
+    op.execute('ALTER TABLE venues ALTER COLUMN geohash TYPE varchar(12) COLLATE "default"')
+    op.execute("ALTER TABLE venues CLUSTER ON ix_venues_geohash")
@@ -0,0 +1,35 @@
+"""Store scraper_logs scraper_type and status as native enums
+
+Revision ID: 015_scraper_log_enums
+Revises: 014_venues_geohash_c_collation
+Create Date: 2026-10-15 16:30:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '015_scraper_log_enums'
+down_revision = '014_venues_geohash_c_collation'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 4-byte enum OIDs instead of varchar(20); one table rewrite for both
+    op.execute("CREATE TYPE scraper_type AS ENUM ('ics', 'rss', 'html', 'json', 'csv')")
+    op.execute("CREATE TYPE scraper_status AS ENUM ('success', 'failed', 'partial')")
+    op.execute(
+        "ALTER TABLE scraper_logs "
+        "ALTER COLUMN scraper_type TYPE scraper_type USING scraper_type::scraper_type, "
+        "ALTER COLUMN status TYPE scraper_status USING status::scraper_status"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE scraper_logs "
+        "ALTER COLUMN scraper_type TYPE varchar(20) USING scraper_type::text, "
+        "ALTER COLUMN status TYPE varchar(20) USING status::text"
+    )
+    op.execute("DROP TYPE scraper_status")
+    op.execute("DROP TYPE scraper_type")
@@ -0,0 +1,32 @@
+"""Generate scraper_logs.pass_rate from the activity counters
+
+Revision ID: 016_scraper_logs_generated_pass_rate
+Revises: 015_scraper_log_enums
+Create Date: 2026-10-15 17:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '016_scraper_logs_generated_pass_rate'
+down_revision = '015_scraper_log_enums'
+branch_labels = None
+depends_on = None
+
+PASS_RATE_EXPR = (
+    "CASE WHEN activities_found > 0 "
+    "THEN activities_passed::float8 * 100 / activities_found END"
+)
+
+
+def upgrade() -> None:
+    # A column cannot be converted to GENERATED in place; replacing it
+    # recomputes every row from the counters
+    op.execute(
+        "ALTER TABLE scraper_logs DROP COLUMN pass_rate, "
+        f"ADD COLUMN pass_rate double precision GENERATED ALWAYS AS ({PASS_RATE_EXPR}) STORED"
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE scraper_logs ALTER COLUMN pass_rate DROP EXPRESSION")
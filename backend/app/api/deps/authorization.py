@@ -2,9 +2,10 @@
 Authorization helpers for multi-tenant access control.
 """
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.deps import UserFlags
 from app.models.child import ChildProfile
 from app.models.family import Family
 from app.models.user import User
@@ -12,7 +13,7 @@ from app.models.user import User
 
 async def verify_child_access(
     child_profile_id: int,
-    current_user: User,
+    current_user: User | UserFlags,
     db: AsyncSession,
 ) -> tuple[ChildProfile, Family]:
     """
@@ -32,39 +33,38 @@ async def verify_child_access(
     Raises:
         HTTPException: 404 if child not found, 403 if not authorized
     """
-    # Fetch child and family in a single query with JOIN
-    # This enforces tenant isolation at the query level
+    # Fetch child and family in a single query. The family is LEFT JOINed on
+    # ownership, so another tenant's family row is never loaded and a NULL
+    # family distinguishes 403 from 404 without a second round-trip.
     result = await db.execute(
         select(ChildProfile, Family)
-        .join(Family, ChildProfile.family_id == Family.id)
+        .outerjoin(
+            Family,
+            and_(
+                ChildProfile.family_id == Family.id,
+                Family.owner_id == current_user.id,  # Tenant isolation
+            ),
+        )
         .where(
             ChildProfile.id == child_profile_id,
             ChildProfile.deleted_at.is_(None),  # Exclude soft-deleted
-            Family.owner_id == current_user.id,  # Tenant isolation
         )
     )
     row = result.one_or_none()
 
-    if not row:
-        # Check if child exists at all (for proper 403 vs 404)
-        exists = await db.execute(
-            select(ChildProfile).where(
-                ChildProfile.id == child_profile_id,
-                ChildProfile.deleted_at.is_(None),
-            )
+    if row is None:
+        # Child doesn't exist - 404 Not Found
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Child profile not found",
         )
-        if exists.scalar_one_or_none():
-            # Child exists but user doesn't own it - 403 Forbidden
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not authorized to access this child profile",
-            )
-        else:
-            # Child doesn't exist - 404 Not Found
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Child profile not found",
-            )
 
     child, family = row
+    if family is None:
+        # Child exists but user doesn't own it - 403 Forbidden
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to access this child profile",
+        )
+
     return child, family
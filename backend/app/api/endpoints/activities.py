@@ -1,70 +1,167 @@
 """
 Activity catalog endpoints.
 """
-from fastapi import APIRouter, HTTPException, Query, status
-from typing import Optional
-from sqlalchemy import select
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
+from typing import Optional, Union
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
+from app.api.http_cache import etag_matches, make_etag
 from app.core.deps import DatabaseSession
 from app.models.activity import Activity
 from app.models.provider import Provider
 from app.models.venue import Venue
 from app.schemas.activity import ActivityResponse, ProviderResponse, VenueResponse
+from app.schemas.base import TrustedResponse
 
 router = APIRouter(prefix="/activities", tags=["activities"])
 
+# Response header carrying the keyset cursor for the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _set_next_cursor(response: Response, rows: list, limit: int) -> None:
+    """Expose the last row's id as the next-page cursor when the page is full."""
+    if len(rows) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = str(rows[-1].id)
+
+
+def _trusted_list_response(schema: type[TrustedResponse], rows: list) -> Response:
+    """
+    Serialize ORM rows without building or validating response models.
+
+    Returning a Response skips FastAPI's response_model validation; the
+    response_model on the route still documents the shape.
+    """
+    return Response(content=schema.encode_trusted(rows), media_type="application/json")
+
 
 @router.get("", response_model=list[ActivityResponse])
 async def list_activities(
     db: DatabaseSession,
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    request: Request,
+    after_id: Optional[int] = Query(None, ge=0, description="Return records with id greater than this cursor"),
     limit: int = Query(50, ge=1, le=100, description="Number of records to return"),
     activity_type: Optional[str] = Query(None, description="Filter by activity type"),
     min_age: Optional[int] = Query(None, ge=0, le=18, description="Filter by minimum age"),
     max_age: Optional[int] = Query(None, ge=0, le=18, description="Filter by maximum age"),
     is_active: bool = Query(True, description="Filter by active status"),
-) -> list[Activity]:
+) -> Response:
     """
     List activities with optional filters.
 
-    Returns paginated list of activities.
+    Returns a keyset-paginated list of activities ordered by id. Pass the
+    X-Next-Cursor response header back as after_id to fetch the next page.
+    Supports conditional requests via ETag / If-None-Match.
     """
-    query = select(Activity).where(Activity.is_active == is_active)
+    conditions = [Activity.is_active == is_active]
 
     # Apply filters
     if activity_type:
-        query = query.where(Activity.activity_type == activity_type)
+        conditions.append(Activity.activity_type == activity_type)
 
     if min_age is not None:
-        query = query.where(
+        conditions.append(
             (Activity.min_age <= min_age) | (Activity.min_age.is_(None))
         )
 
     if max_age is not None:
-        query = query.where(
+        conditions.append(
             (Activity.max_age >= max_age) | (Activity.max_age.is_(None))
         )
 
-    # Apply pagination
-    query = query.offset(skip).limit(limit)
+    # Apply keyset pagination (index seek instead of scanning skipped rows)
+    if after_id is not None:
+        conditions.append(Activity.id > after_id)
+
+    etag_key = (after_id, limit, activity_type, min_age, max_age, is_active)
+    etag = None
+
+    # Revalidation only: cheap freshness probe over just this page's window
+    # (same filters, order and LIMIT as the page query), so it never scans
+    # past the page; skip the page query entirely if unchanged. The last id
+    # catches rows deleted inside the window, which shifts it without
+    # touching updated_at.
+    if request.headers.get("if-none-match"):
+        page_window = (
+            select(Activity.id, Activity.updated_at)
+            .where(*conditions)
+            .order_by(Activity.id)
+            .limit(limit)
+            .subquery()
+        )
+        result = await db.execute(
+            select(
+                func.max(page_window.c.updated_at),
+                func.count(),
+                func.max(page_window.c.id),
+            )
+        )
+        etag = make_etag(*etag_key, *result.one())
+        if etag_matches(request, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
 
-    result = await db.execute(query)
-    activities = result.scalars().all()
+    # ActivityResponse only exposes provider_id/venue_id; refuse lazy loads of
+    # the relationships so a schema change can't silently introduce N+1 queries.
+    result = await db.execute(
+        select(Activity)
+        .options(raiseload(Activity.provider), raiseload(Activity.venue))
+        .where(*conditions)
+        .order_by(Activity.id)
+        .limit(limit)
+    )
+    activities = list(result.scalars().all())
+
+    if etag is None:
+        # Same values the probe computes, taken from the rows already loaded
+        etag = make_etag(
+            *etag_key,
+            max((activity.updated_at for activity in activities), default=None),
+            len(activities),
+            activities[-1].id if activities else None,
+        )
 
-    return list(activities)
+    response = _trusted_list_response(ActivityResponse, activities)
+    _set_next_cursor(response, activities, limit)
+    response.headers["ETag"] = etag
+
+    return response
 
 
 @router.get("/{activity_id}", response_model=ActivityResponse)
 async def get_activity(
     activity_id: int,
     db: DatabaseSession,
-) -> Activity:
+    request: Request,
+    response: Response,
+) -> Union[Activity, Response]:
     """
     Get a specific activity by ID.
+
+    Supports conditional requests via ETag / If-None-Match.
     """
+    # Revalidation only: check updated_at before loading the whole row
+    if request.headers.get("if-none-match"):
+        result = await db.execute(
+            select(Activity.updated_at).where(Activity.id == activity_id)
+        )
+        updated_at = result.scalar_one_or_none()
+
+        if updated_at is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Activity not found",
+            )
+
+        etag = make_etag(activity_id, updated_at)
+        if etag_matches(request, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
     result = await db.execute(
-        select(Activity).where(Activity.id == activity_id)
+        select(Activity)
+        .options(raiseload(Activity.provider), raiseload(Activity.venue))
+        .where(Activity.id == activity_id)
     )
     activity = result.scalar_one_or_none()
 
@@ -74,38 +171,47 @@ async def get_activity(
             detail="Activity not found",
         )
 
+    response.headers["ETag"] = make_etag(activity_id, activity.updated_at)
     return activity
 
 
 @router.get("/providers", response_model=list[ProviderResponse])
 async def list_providers(
     db: DatabaseSession,
-    skip: int = Query(0, ge=0),
+    after_id: Optional[int] = Query(None, ge=0),
     limit: int = Query(50, ge=1, le=100),
-) -> list[Provider]:
+) -> Response:
     """
     List activity providers.
     """
-    result = await db.execute(
-        select(Provider).offset(skip).limit(limit)
-    )
-    providers = result.scalars().all()
+    query = select(Provider)
+    if after_id is not None:
+        query = query.where(Provider.id > after_id)
+
+    result = await db.execute(query.order_by(Provider.id).limit(limit))
+    providers = list(result.scalars().all())
+    response = _trusted_list_response(ProviderResponse, providers)
+    _set_next_cursor(response, providers, limit)
 
-    return list(providers)
+    return response
 
 
 @router.get("/venues", response_model=list[VenueResponse])
 async def list_venues(
     db: DatabaseSession,
-    skip: int = Query(0, ge=0),
+    after_id: Optional[int] = Query(None, ge=0),
     limit: int = Query(50, ge=1, le=100),
-) -> list[Venue]:
+) -> Response:
     """
     List activity venues.
     """
-    result = await db.execute(
-        select(Venue).offset(skip).limit(limit)
-    )
-    venues = result.scalars().all()
+    query = select(Venue)
+    if after_id is not None:
+        query = query.where(Venue.id > after_id)
+
+    result = await db.execute(query.order_by(Venue.id).limit(limit))
+    venues = list(result.scalars().all())
+    response = _trusted_list_response(VenueResponse, venues)
+    _set_next_cursor(response, venues, limit)
 
-    return list(venues)
+    return response
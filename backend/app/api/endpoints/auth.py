@@ -1,20 +1,23 @@
 """
 Authentication endpoints.
 """
-from typing import Annotated, Optional
+from typing import Annotated, Any, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from jose import JWTError
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.security import HTTPAuthorizationCredentials
+from jwt import InvalidTokenError
+from sqlalchemy import bindparam, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.deps import DatabaseSession, get_current_user
+from app.core.deps import DatabaseSession, TokenPayload, get_current_user, security
 from app.core.security import (
+    aget_password_hash,
+    averify_dummy_password,
+    averify_password,
     create_access_token,
     create_refresh_token,
     decode_token,
-    get_password_hash,
-    verify_password,
+    password_needs_rehash,
 )
 from app.models.user import User
 from app.schemas.auth import Token, TokenRefresh, UserLogin, UserRegister, UserResponse
@@ -22,6 +25,28 @@ from app.schemas.auth import Token, TokenRefresh, UserLogin, UserRegister, UserR
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
+def _profile_claims(user: Any) -> dict[str, Any]:
+    """Claims that let /auth/me answer from the token alone."""
+    return {
+        "email": user.email,
+        "is_active": user.is_active,
+        "created_at": user.created_at.isoformat(),
+    }
+
+
+# Profile claims /auth/me needs to skip the database
+_PROFILE_CLAIMS = ("email", "is_active", "created_at")
+
+# Hot auth statements, built once at import and executed with bound params
+_USER_ID_BY_EMAIL = select(User.id).where(func.lower(User.email) == bindparam("email"))
+_LOGIN_USER_BY_EMAIL = select(
+    User.id, User.email, User.hashed_password, User.is_active, User.created_at
+).where(func.lower(User.email) == bindparam("email"))
+_REFRESH_USER_BY_ID = select(User.id, User.email, User.is_active, User.created_at).where(
+    User.id == bindparam("user_id")
+)
+
+
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def register(
     user_in: UserRegister,
@@ -33,20 +58,26 @@ async def register(
     Creates a new user account with email and password.
     Returns the created user details.
     """
+    # Emails are case-insensitive; store and compare lowercased
+    email = user_in.email.lower()
+
     # Check if user already exists
-    result = await db.execute(select(User).where(User.email == user_in.email))
-    existing_user = result.scalar_one_or_none()
+    result = await db.execute(_USER_ID_BY_EMAIL, {"email": email})
+    existing_user_id = result.scalar_one_or_none()
 
-    if existing_user:
+    if existing_user_id is not None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered",
         )
 
+    # Hash off the event loop - argon2 is CPU-bound
+    hashed_password = await aget_password_hash(user_in.password)
+
     # Create new user
     user = User(
-        email=user_in.email,
-        hashed_password=get_password_hash(user_in.password),
+        email=email,
+        hashed_password=hashed_password,
         is_active=True,
     )
 
@@ -67,18 +98,20 @@ async def login(
 
     Returns JWT access and refresh tokens.
     """
-    # Get user by email
-    result = await db.execute(select(User).where(User.email == user_in.email))
-    user = result.scalar_one_or_none()
+    # Get user by email (only the columns needed to authenticate)
+    result = await db.execute(_LOGIN_USER_BY_EMAIL, {"email": user_in.email.lower()})
+    user = result.one_or_none()
 
     if not user:
+        # Same cost as a wrong password so timing doesn't reveal unknown emails
+        await averify_dummy_password(user_in.password)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
         )
 
-    # Verify password
-    if not verify_password(user_in.password, user.hashed_password):
+    # Verify password off the event loop so concurrent logins don't serialize
+    if not await averify_password(user_in.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -91,10 +124,17 @@ async def login(
             detail="Inactive user account",
         )
 
+    # Migrate legacy bcrypt hashes to argon2id while the plain password is at hand
+    if password_needs_rehash(user.hashed_password):
+        new_hash = await aget_password_hash(user_in.password)
+        await db.execute(
+            update(User).where(User.id == user.id).values(hashed_password=new_hash)
+        )
+
     # Create tokens
     access_token = create_access_token(
         subject=user.id,
-        additional_claims={"email": user.email},
+        additional_claims=_profile_claims(user),
     )
     refresh_token = create_refresh_token(subject=user.id)
 
@@ -128,12 +168,12 @@ async def refresh_token(
         if user_id is None or token_type != "refresh":
             raise credentials_exception
 
-    except JWTError:
+    except InvalidTokenError:
         raise credentials_exception
 
     # Get user from database
-    result = await db.execute(select(User).where(User.id == int(user_id)))
-    user = result.scalar_one_or_none()
+    result = await db.execute(_REFRESH_USER_BY_ID, {"user_id": int(user_id)})
+    user = result.one_or_none()
 
     if user is None or not user.is_active:
         raise credentials_exception
@@ -141,7 +181,7 @@ async def refresh_token(
     # Create new tokens
     access_token = create_access_token(
         subject=user.id,
-        additional_claims={"email": user.email},
+        additional_claims=_profile_claims(user),
     )
     refresh_token = create_refresh_token(subject=user.id)
 
@@ -154,11 +194,40 @@ async def refresh_token(
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(
-    current_user: Annotated[User, Depends(get_current_user)],
-) -> User:
+    payload: TokenPayload,
+    credentials: Annotated[Optional[HTTPAuthorizationCredentials], Depends(security)],
+    db: DatabaseSession,
+    fresh: bool = Query(False, description="Read the user from the database instead of token claims"),
+) -> Union[User, UserResponse]:
     """
     Get current authenticated user information.
 
-    Returns the current user's details.
+    Answers from the access token's claims without a database round-trip.
+    fresh=true reads the user row directly, bypassing every cache; tokens
+    that predate the profile claims go through get_current_user.
     """
-    return current_user
+    if fresh:
+        result = await db.execute(select(User).where(User.id == int(payload["sub"])))
+        user = result.scalar_one_or_none()
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Could not validate credentials",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        if not user.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Inactive user",
+            )
+        return user
+
+    if any(claim not in payload for claim in _PROFILE_CLAIMS):
+        return await get_current_user(credentials, db)
+
+    return UserResponse(
+        id=int(payload["sub"]),
+        email=payload["email"],
+        is_active=payload["is_active"],
+        created_at=payload["created_at"],
+    )
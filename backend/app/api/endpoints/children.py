@@ -1,32 +1,86 @@
 """
 Child profile endpoints.
 """
-from fastapi import APIRouter, HTTPException, status
-from sqlalchemy import select
+from typing import Optional, Union
+
+import orjson
+from fastapi import APIRouter, HTTPException, Request, Response, status
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.deps import CurrentActiveUser, DatabaseSession
+from app.api.http_cache import etag_matches, make_etag
+from app.core.deps import CurrentFamilyId, DatabaseSession
 from app.models.child import ChildProfile, PREDEFINED_GOALS
-from app.models.family import Family
 from app.schemas.child import ChildProfileCreate, ChildProfileResponse, ChildProfileUpdate
 
 router = APIRouter(prefix="/children", tags=["children"])
 
+# PREDEFINED_GOALS only changes with a deploy, so its body and ETag are built once
+_GOALS_BODY = orjson.dumps(PREDEFINED_GOALS)
+_GOALS_ETAG = make_etag(_GOALS_BODY)
+_GOALS_CACHE_HEADERS = {
+    "ETag": _GOALS_ETAG,
+    "Cache-Control": "public, max-age=86400",
+}
+
+
+async def _get_owned_child(
+    child_id: int,
+    family_id: Optional[int],
+    db: AsyncSession,
+) -> ChildProfile:
+    """
+    Fetch a child profile owned by the given family.
+
+    Uses a primary-key lookup (identity map first) against the cached family
+    id, so a warm request issues at most one simple SELECT.
+
+    Raises:
+        HTTPException: 404 if the child doesn't exist or isn't owned by the user
+    """
+    child = await db.get(ChildProfile, child_id)
+
+    if child is None or child.deleted_at is not None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Child profile not found",
+        )
+
+    if family_id is None or child.family_id != family_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Child profile not found",
+        )
+
+    return child
+
 
 @router.get("/goals", response_model=list[str])
-async def get_predefined_goals() -> list[str]:
+async def get_predefined_goals(request: Request) -> Union[list[str], Response]:
     """
     Get predefined goals taxonomy.
 
     Returns the list of predefined goals that parents can select from.
+    Served from a prebuilt body; supports conditional requests via ETag.
     """
-    return PREDEFINED_GOALS
+    if etag_matches(request, _GOALS_ETAG):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers=_GOALS_CACHE_HEADERS,
+        )
+
+    return Response(
+        content=_GOALS_BODY,
+        media_type="application/json",
+        headers=_GOALS_CACHE_HEADERS,
+    )
 
 
 @router.post("", response_model=ChildProfileResponse, status_code=status.HTTP_201_CREATED)
 async def create_child_profile(
     child_in: ChildProfileCreate,
-    current_user: CurrentActiveUser,
+    family_id: CurrentFamilyId,
     db: DatabaseSession,
 ) -> ChildProfile:
     """
@@ -34,87 +88,76 @@ async def create_child_profile(
 
     The user must have a family profile before creating child profiles.
     """
-    # Get user's family
-    result = await db.execute(
-        select(Family).where(Family.owner_id == current_user.id)
-    )
-    family = result.scalar_one_or_none()
-
-    if not family:
+    if family_id is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="You must create a family profile before adding children",
         )
 
-    # Convert temperament and constraints to dict for JSONB storage
-    temperament_dict = None
-    if child_in.temperament:
-        temperament_dict = child_in.temperament.model_dump()
-
-    constraints_dict = None
-    if child_in.constraints:
-        # Convert ScheduleWindow objects to dicts
-        constraints_data = child_in.constraints.model_dump()
-        if constraints_data.get("schedule_windows"):
-            constraints_data["schedule_windows"] = [
-                window for window in constraints_data["schedule_windows"]
-            ]
-        constraints_dict = constraints_data
-
-    # Create child profile
-    child = ChildProfile(
-        family_id=family.id,
-        name=child_in.name,
-        birth_date=child_in.birth_date,
-        temperament=temperament_dict,
-        primary_goal=child_in.primary_goal,
-        secondary_goal=child_in.secondary_goal,
-        tertiary_goal=child_in.tertiary_goal,
-        custom_goals=child_in.custom_goals,
-        constraints=constraints_dict,
-        preferred_activity_types=child_in.preferred_activity_types,
-        notes=child_in.notes,
+    # Convert temperament and constraints to JSON-ready dicts for JSONB storage
+    # (model_dump already turns nested ScheduleWindow models into dicts)
+    temperament_dict = (
+        child_in.temperament.model_dump(mode="json") if child_in.temperament else None
+    )
+    constraints_dict = (
+        child_in.constraints.model_dump(mode="json") if child_in.constraints else None
     )
 
-    db.add(child)
+    # Create child profile; RETURNING hydrates server defaults without a refresh
+    result = await db.execute(
+        insert(ChildProfile)
+        .values(
+            family_id=family_id,
+            name=child_in.name,
+            birth_date=child_in.birth_date,
+            temperament=temperament_dict,
+            primary_goal=child_in.primary_goal,
+            secondary_goal=child_in.secondary_goal,
+            tertiary_goal=child_in.tertiary_goal,
+            custom_goals=child_in.custom_goals,
+            constraints=constraints_dict,
+            preferred_activity_types=child_in.preferred_activity_types,
+            notes=child_in.notes,
+        )
+        .returning(ChildProfile)
+    )
+    child = result.scalar_one()
     await db.commit()
-    await db.refresh(child)
 
     return child
 
 
 @router.get("", response_model=list[ChildProfileResponse])
 async def list_children(
-    current_user: CurrentActiveUser,
+    family_id: CurrentFamilyId,
     db: DatabaseSession,
-) -> list[ChildProfile]:
+) -> Response:
     """
     List all children in the current user's family.
-    """
-    # Get user's family
-    result = await db.execute(
-        select(Family).where(Family.owner_id == current_user.id)
-    )
-    family = result.scalar_one_or_none()
 
-    if not family:
-        return []
+    Rows are serialized without per-row validation (see TrustedResponse).
+    """
+    if family_id is None:
+        return ORJSONResponse([])
 
-    # Get children
+    # Served by the partial (family_id) WHERE deleted_at IS NULL index
     result = await db.execute(
         select(ChildProfile)
-        .where(ChildProfile.family_id == family.id)
+        .where(ChildProfile.family_id == family_id)
         .where(ChildProfile.deleted_at.is_(None))
     )
     children = result.scalars().all()
 
-    return list(children)
+    return Response(
+        content=ChildProfileResponse.encode_trusted(children),
+        media_type="application/json",
+    )
 
 
 @router.get("/{child_id}", response_model=ChildProfileResponse)
 async def get_child_profile(
     child_id: int,
-    current_user: CurrentActiveUser,
+    family_id: CurrentFamilyId,
     db: DatabaseSession,
 ) -> ChildProfile:
     """
@@ -122,41 +165,14 @@ async def get_child_profile(
 
     Only returns children belonging to the current user's family.
     """
-    # Get user's family
-    result = await db.execute(
-        select(Family).where(Family.owner_id == current_user.id)
-    )
-    family = result.scalar_one_or_none()
-
-    if not family:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Child profile not found",
-        )
-
-    # Get child
-    result = await db.execute(
-        select(ChildProfile)
-        .where(ChildProfile.id == child_id)
-        .where(ChildProfile.family_id == family.id)
-        .where(ChildProfile.deleted_at.is_(None))
-    )
-    child = result.scalar_one_or_none()
-
-    if not child:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Child profile not found",
-        )
-
-    return child
+    return await _get_owned_child(child_id, family_id, db)
 
 
 @router.patch("/{child_id}", response_model=ChildProfileResponse)
 async def update_child_profile(
     child_id: int,
     child_update: ChildProfileUpdate,
-    current_user: CurrentActiveUser,
+    family_id: CurrentFamilyId,
     db: DatabaseSession,
 ) -> ChildProfile:
     """
@@ -164,24 +180,18 @@ async def update_child_profile(
 
     Only updates children belonging to the current user's family.
     """
-    # Get user's family
-    result = await db.execute(
-        select(Family).where(Family.owner_id == current_user.id)
-    )
-    family = result.scalar_one_or_none()
-
-    if not family:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Child profile not found",
-        )
+    update_data = child_update.model_dump(exclude_unset=True)
+    if not update_data or family_id is None:
+        return await _get_owned_child(child_id, family_id, db)
 
-    # Get child
+    # Ownership check and update in one UPDATE ... RETURNING
     result = await db.execute(
-        select(ChildProfile)
+        update(ChildProfile)
         .where(ChildProfile.id == child_id)
-        .where(ChildProfile.family_id == family.id)
+        .where(ChildProfile.family_id == family_id)
         .where(ChildProfile.deleted_at.is_(None))
+        .values(**update_data)
+        .returning(ChildProfile)
     )
     child = result.scalar_one_or_none()
 
@@ -191,13 +201,7 @@ async def update_child_profile(
             detail="Child profile not found",
         )
 
-    # Update fields
-    update_data = child_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(child, field, value)
-
     await db.commit()
-    await db.refresh(child)
 
     return child
 
@@ -205,7 +209,7 @@ async def update_child_profile(
 @router.delete("/{child_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_child_profile(
     child_id: int,
-    current_user: CurrentActiveUser,
+    family_id: CurrentFamilyId,
     db: DatabaseSession,
 ) -> None:
     """
@@ -213,33 +217,20 @@ async def delete_child_profile(
 
     Uses soft delete to preserve data for potential recovery.
     """
-    # Get user's family
-    result = await db.execute(
-        select(Family).where(Family.owner_id == current_user.id)
-    )
-    family = result.scalar_one_or_none()
-
-    if not family:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Child profile not found",
-        )
-
-    # Get child
+    # Ownership check and soft delete in one UPDATE ... RETURNING
     result = await db.execute(
-        select(ChildProfile)
+        update(ChildProfile)
         .where(ChildProfile.id == child_id)
-        .where(ChildProfile.family_id == family.id)
+        .where(ChildProfile.family_id == family_id)
         .where(ChildProfile.deleted_at.is_(None))
+        .values(deleted_at=func.now())
+        .returning(ChildProfile.id)
     )
-    child = result.scalar_one_or_none()
 
-    if not child:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Child profile not found",
         )
 
-    # Soft delete
-    child.soft_delete()
     await db.commit()
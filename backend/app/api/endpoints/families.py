@@ -2,10 +2,16 @@
 Family profile endpoints.
 """
 from fastapi import APIRouter, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.deps import CurrentActiveUser, DatabaseSession
+from app.core.cache import family_cache
+from app.core.deps import (
+    CurrentFamily,
+    CurrentFamilyId,
+    CurrentUserFlags,
+    DatabaseSession,
+)
 from app.models.family import Family
 from app.schemas.family import FamilyCreate, FamilyResponse, FamilyUpdate
 
@@ -15,7 +21,8 @@ router = APIRouter(prefix="/families", tags=["families"])
 @router.post("", response_model=FamilyResponse, status_code=status.HTTP_201_CREATED)
 async def create_family(
     family_in: FamilyCreate,
-    current_user: CurrentActiveUser,
+    current_user: CurrentUserFlags,
+    existing_family_id: CurrentFamilyId,
     db: DatabaseSession,
 ) -> Family:
     """
@@ -23,65 +30,56 @@ async def create_family(
 
     Each user can only have one family profile.
     """
-    # Check if user already has a family
-    result = await db.execute(
-        select(Family).where(Family.owner_id == current_user.id)
-    )
-    existing_family = result.scalar_one_or_none()
-
-    if existing_family:
+    # Only existence matters here, so check the (cached) id, not the full row
+    if existing_family_id is not None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User already has a family profile",
         )
 
-    # Create family
-    family = Family(
-        owner_id=current_user.id,
-        **family_in.model_dump(),
+    # Create family; RETURNING hydrates server defaults without a refresh
+    result = await db.execute(
+        insert(Family)
+        .values(owner_id=current_user.id, **family_in.model_dump())
+        .returning(Family)
     )
-
-    db.add(family)
+    family = result.scalar_one()
     await db.commit()
-    await db.refresh(family)
+    await family_cache.invalidate(current_user.id)
 
     return family
 
 
 @router.get("/me", response_model=FamilyResponse)
-async def get_my_family(
-    current_user: CurrentActiveUser,
-    db: DatabaseSession,
-) -> Family:
+async def get_my_family(family: CurrentFamily) -> Family:
     """
     Get the current user's family profile.
     """
-    result = await db.execute(
-        select(Family).where(Family.owner_id == current_user.id)
-    )
-    family = result.scalar_one_or_none()
-
-    if not family:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Family profile not found",
-        )
-
     return family
 
 
 @router.patch("/me", response_model=FamilyResponse)
 async def update_my_family(
     family_update: FamilyUpdate,
-    current_user: CurrentActiveUser,
+    current_user: CurrentUserFlags,
     db: DatabaseSession,
 ) -> Family:
     """
     Update the current user's family profile.
     """
-    result = await db.execute(
-        select(Family).where(Family.owner_id == current_user.id)
-    )
+    update_data = family_update.model_dump(exclude_unset=True)
+    if update_data:
+        # Update and fetch in one UPDATE ... RETURNING
+        result = await db.execute(
+            update(Family)
+            .where(Family.owner_id == current_user.id)
+            .values(**update_data)
+            .returning(Family)
+        )
+    else:
+        result = await db.execute(
+            select(Family).where(Family.owner_id == current_user.id)
+        )
     family = result.scalar_one_or_none()
 
     if not family:
@@ -90,20 +88,14 @@ async def update_my_family(
             detail="Family profile not found",
         )
 
-    # Update fields
-    update_data = family_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(family, field, value)
-
     await db.commit()
-    await db.refresh(family)
 
     return family
 
 
 @router.delete("/me", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_my_family(
-    current_user: CurrentActiveUser,
+    family: CurrentFamily,
     db: DatabaseSession,
 ) -> None:
     """
@@ -111,16 +103,6 @@ async def delete_my_family(
 
     This will also delete all associated child profiles (cascade).
     """
-    result = await db.execute(
-        select(Family).where(Family.owner_id == current_user.id)
-    )
-    family = result.scalar_one_or_none()
-
-    if not family:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Family profile not found",
-        )
-
     await db.delete(family)
     await db.commit()
+    await family_cache.invalidate(family.owner_id)
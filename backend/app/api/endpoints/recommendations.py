@@ -6,30 +6,85 @@ SECURITY: This module implements defense-in-depth tenant isolation by:
 2. Explicit family_id filtering in all queries
 3. Single JOIN query for efficient authorization
 """
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.api.deps.authorization import verify_child_access
-from app.core.deps import CurrentActiveUser, DatabaseSession
+from app.core.deps import CurrentUserFlags, DatabaseSession
 from app.models.activity import Activity
 from app.models.child import ChildProfile
-from app.models.family import Family
 from app.models.provider import Provider
 from app.models.recommendation import Recommendation
-from app.schemas.recommendation import RecommendationRequest, RecommendationResponse
+from app.schemas.recommendation import (
+    RecommendationRequest,
+    RecommendationResponse,
+    RecommendationResponseList,
+)
 from app.services.recommender import RecommendationService
 
 router = APIRouter(prefix="/recommendations", tags=["recommendations"])
 
 
+async def _fetch_recommendations(
+    db: AsyncSession,
+    child_profile_id: int,
+    family_id: int,
+) -> Response:
+    """
+    Load a child's recommendations as a JSON response.
+
+    Selects only the response columns in one JOIN query instead of hydrating
+    Recommendation -> Activity -> Provider ORM graphs. The rows are validated
+    and encoded as one list by RecommendationResponseList. Returning a
+    Response skips FastAPI's second response_model validation; the route's
+    response_model still documents the shape.
+    """
+    result = await db.execute(
+        select(
+            Recommendation.id,
+            Recommendation.child_profile_id,
+            Recommendation.activity_id,
+            Activity.name.label("activity_name"),
+            Provider.name.label("provider_name"),
+            Recommendation.total_score,
+            Recommendation.fit_score,
+            Recommendation.practical_score,
+            Recommendation.goals_score,
+            Recommendation.score_details,
+            Recommendation.tier,
+            Recommendation.explanation,
+            Recommendation.why_good_fit,
+            Recommendation.considerations,
+            Recommendation.future_benefits,
+            Recommendation.generated_at,
+        )
+        .join(Activity, Activity.id == Recommendation.activity_id)
+        .join(Provider, Provider.id == Activity.provider_id)
+        .join(ChildProfile, ChildProfile.id == Recommendation.child_profile_id)
+        .where(
+            Recommendation.child_profile_id == child_profile_id,
+            ChildProfile.family_id == family_id,  # Explicit tenant isolation
+        )
+        .order_by(Recommendation.total_score.desc())
+    )
+
+    recommendations = RecommendationResponseList.validate_python(
+        result.all(),
+        from_attributes=True,
+    )
+    return Response(
+        content=RecommendationResponseList.dump_json(recommendations),
+        media_type="application/json",
+    )
+
+
 @router.post("", response_model=list[RecommendationResponse])
 async def generate_recommendations(
     request: RecommendationRequest,
-    current_user: CurrentActiveUser,
+    current_user: CurrentUserFlags,
     db: DatabaseSession,
-) -> list[dict]:
+) -> Response:
     """
     Generate activity recommendations for a child.
 
@@ -54,51 +109,15 @@ async def generate_recommendations(
     )
 
     # Load related data with explicit family filtering (defense-in-depth)
-    result = await db.execute(
-        select(Recommendation)
-        .join(Recommendation.child_profile)
-        .where(
-            Recommendation.child_profile_id == request.child_profile_id,
-            ChildProfile.family_id == family.id,  # Explicit tenant isolation
-        )
-        .order_by(Recommendation.total_score.desc())
-        .options(
-            selectinload(Recommendation.activity).selectinload(Activity.provider)
-        )
-    )
-    recommendations_with_data = result.scalars().all()
-
-    # Format response
-    response = []
-    for rec in recommendations_with_data:
-        response.append({
-            "id": rec.id,
-            "child_profile_id": rec.child_profile_id,
-            "activity_id": rec.activity_id,
-            "activity_name": rec.activity.name,
-            "provider_name": rec.activity.provider.name,
-            "total_score": float(rec.total_score),
-            "fit_score": float(rec.fit_score),
-            "practical_score": float(rec.practical_score),
-            "goals_score": float(rec.goals_score),
-            "score_details": rec.score_details,
-            "tier": rec.tier,
-            "explanation": rec.explanation,
-            "why_good_fit": rec.why_good_fit,
-            "considerations": rec.considerations,
-            "future_benefits": rec.future_benefits,
-            "generated_at": rec.generated_at.isoformat(),
-        })
-
-    return response
+    return await _fetch_recommendations(db, request.child_profile_id, family.id)
 
 
 @router.get("/{child_profile_id}", response_model=list[RecommendationResponse])
 async def get_recommendations(
     child_profile_id: int,
-    current_user: CurrentActiveUser,
+    current_user: CurrentUserFlags,
     db: DatabaseSession,
-) -> list[dict]:
+) -> Response:
     """
     Get existing recommendations for a child.
 
@@ -110,40 +129,4 @@ async def get_recommendations(
     child, family = await verify_child_access(child_profile_id, current_user, db)
 
     # Get recommendations with explicit family filtering (defense-in-depth)
-    result = await db.execute(
-        select(Recommendation)
-        .join(Recommendation.child_profile)
-        .where(
-            Recommendation.child_profile_id == child_profile_id,
-            ChildProfile.family_id == family.id,  # Explicit tenant isolation
-        )
-        .order_by(Recommendation.total_score.desc())
-        .options(
-            selectinload(Recommendation.activity).selectinload(Activity.provider)
-        )
-    )
-    recommendations = result.scalars().all()
-
-    # Format response
-    response = []
-    for rec in recommendations:
-        response.append({
-            "id": rec.id,
-            "child_profile_id": rec.child_profile_id,
-            "activity_id": rec.activity_id,
-            "activity_name": rec.activity.name,
-            "provider_name": rec.activity.provider.name,
-            "total_score": float(rec.total_score),
-            "fit_score": float(rec.fit_score),
-            "practical_score": float(rec.practical_score),
-            "goals_score": float(rec.goals_score),
-            "score_details": rec.score_details,
-            "tier": rec.tier,
-            "explanation": rec.explanation,
-            "why_good_fit": rec.why_good_fit,
-            "considerations": rec.considerations,
-            "future_benefits": rec.future_benefits,
-            "generated_at": rec.generated_at.isoformat(),
-        })
-
-    return response
+    return await _fetch_recommendations(db, child_profile_id, family.id)
@@ -0,0 +1,161 @@
+"""
+Redis-backed lookup caches.
+
+Caches hold ids and flags only - never PII. Redis failures fall back to the
+database loader so a cache outage never fails a request.
+"""
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Optional
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Connections are opened lazily on first command
+redis_client: Redis = Redis.from_url(settings.redis_url, decode_responses=True)
+
+
+class FamilyIdCache:
+    """
+    Read-through cache of family id by owner user id.
+
+    Keyed by ``family:by_owner:{user_id}``. Only successful lookups are cached;
+    invalidate when a family is created or deleted.
+    """
+
+    key_prefix = "family:by_owner:"
+
+    def __init__(self, client: Redis, ttl_seconds: int = 3600):
+        """
+        Initialize cache.
+
+        Args:
+            client: Redis client
+            ttl_seconds: Expiry for cached entries
+        """
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+
+    def _key(self, user_id: int) -> str:
+        return f"{self.key_prefix}{user_id}"
+
+    async def get_or_fetch(
+        self,
+        user_id: int,
+        loader: Callable[[], Awaitable[Optional[int]]],
+    ) -> Optional[int]:
+        """
+        Get the user's family id, calling loader on a cache miss.
+
+        Args:
+            user_id: Owner user ID
+            loader: Coroutine factory returning the family id from the database
+
+        Returns:
+            Family ID or None if the user has no family
+        """
+        key = self._key(user_id)
+        try:
+            cached = await self.client.get(key)
+        except RedisError as e:
+            logger.warning(f"Family cache read failed: {str(e)}")
+            return await loader()
+
+        if cached is not None:
+            return int(cached)
+
+        family_id = await loader()
+        if family_id is not None:
+            try:
+                await self.client.set(key, family_id, ex=self.ttl_seconds)
+            except RedisError as e:
+                logger.warning(f"Family cache write failed: {str(e)}")
+
+        return family_id
+
+    async def invalidate(self, user_id: int) -> None:
+        """Drop the cached family id for a user."""
+        try:
+            await self.client.delete(self._key(user_id))
+        except RedisError as e:
+            logger.warning(f"Family cache invalidation failed: {str(e)}")
+
+
+class UserFlagsCache:
+    """
+    Cache of a user's access flags (is_active, is_superuser) by user id.
+
+    Keyed by ``user:active:{user_id}``. Lets authentication skip the user
+    SELECT; the short TTL bounds how long a status change takes to apply
+    on other workers. Invalidate when a user's status changes.
+    """
+
+    key_prefix = "user:active:"
+
+    def __init__(self, client: Redis, ttl_seconds: int = 30):
+        """
+        Initialize cache.
+
+        Args:
+            client: Redis client
+            ttl_seconds: Expiry for cached entries
+        """
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+
+    def _key(self, user_id: int) -> str:
+        return f"{self.key_prefix}{user_id}"
+
+    async def get(self, user_id: int) -> Optional[dict[str, bool]]:
+        """
+        Get cached flags for a user.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            Dict with is_active and is_superuser, or None on a miss or any
+            read/deserialization error
+        """
+        try:
+            cached = await self.client.get(self._key(user_id))
+        except RedisError as e:
+            logger.warning(f"User cache read failed: {str(e)}")
+            return None
+
+        if cached is None:
+            return None
+
+        try:
+            data = json.loads(cached)
+            return {
+                "is_active": bool(data["is_active"]),
+                "is_superuser": bool(data["is_superuser"]),
+            }
+        except (ValueError, TypeError, KeyError) as e:
+            logger.warning(f"Discarding malformed user cache entry: {str(e)}")
+            return None
+
+    async def set(self, user_id: int, is_active: bool, is_superuser: bool) -> None:
+        """Store a user's flags."""
+        value = json.dumps({"is_active": is_active, "is_superuser": is_superuser})
+        try:
+            await self.client.set(self._key(user_id), value, ex=self.ttl_seconds)
+        except RedisError as e:
+            logger.warning(f"User cache write failed: {str(e)}")
+
+    async def invalidate(self, user_id: int) -> None:
+        """Drop the cached flags for a user."""
+        try:
+            await self.client.delete(self._key(user_id))
+        except RedisError as e:
+            logger.warning(f"User cache invalidation failed: {str(e)}")
+
+
+family_cache = FamilyIdCache(redis_client)
+user_flags_cache = UserFlagsCache(redis_client)
@@ -24,6 +24,12 @@ class Settings(BaseSettings):
     app_version: str = Field(default="0.1.0", description="Application version")
     debug: bool = Field(default=False, description="Debug mode")
     environment: str = Field(default="development", description="Environment (development, staging, production)")
+    error_traceback_sample_rate: float = Field(
+        default=0.01,
+        ge=0.0,
+        le=1.0,
+        description="Fraction of unhandled errors logged with a full traceback (always in debug)",
+    )
 
     # API
     api_v1_prefix: str = Field(default="/api/v1", description="API v1 prefix")
@@ -40,6 +46,15 @@ class Settings(BaseSettings):
         description="PostgreSQL database URL"
     )
     database_echo: bool = Field(default=False, description="Echo SQL queries")
+    database_pool_size: int = Field(default=20, description="Persistent connections kept in the pool")
+    database_max_overflow: int = Field(default=30, description="Extra connections allowed above pool_size")
+    database_pool_timeout: int = Field(default=30, description="Seconds to wait for a pooled connection")
+    database_pool_recycle: int = Field(default=1800, description="Seconds before a pooled connection is recycled")
+    database_pool_pre_ping: bool = Field(default=True, description="Check connections for liveness on checkout")
+    database_pgbouncer: bool = Field(
+        default=False,
+        description="DATABASE_URL points at PgBouncer in transaction mode (disables local pooling and statement caches)"
+    )
 
     # Redis
     redis_url: str = Field(default="redis://localhost:6379/0", description="Redis URL")
@@ -47,9 +62,11 @@ class Settings(BaseSettings):
     # Security
     secret_key: str = Field(
         default="CHANGE_ME_IN_PRODUCTION_THIS_IS_INSECURE",
-        description="Secret key for JWT signing"
+        description="Secret key for JWT signing; use at least 256 bits of entropy (openssl rand -hex 32)"
     )
-    algorithm: str = Field(default="HS256", description="JWT algorithm")
+    # Tokens are issued and verified only by this service, so a shared-secret
+    # HMAC is enough and far cheaper to verify than RSA/ECDSA signatures
+    algorithm: str = Field(default="HS256", description="JWT algorithm (HS256, HS384 or HS512)")
     access_token_expire_minutes: int = Field(
         default=30,
         description="Access token expiration in minutes"
@@ -59,14 +76,16 @@ class Settings(BaseSettings):
         description="Refresh token expiration in days"
     )
 
-    # Password hashing
-    pwd_context_schemes: list[str] = Field(
-        default=["bcrypt"],
-        description="Password hashing schemes"
-    )
-    pwd_context_deprecated: str = Field(
-        default="auto",
-        description="Deprecated password schemes"
+    # Password hashing (argon2id). Defaults are the OWASP baseline; tune so one
+    # hash takes ~50-100 ms on production hardware. Existing hashes are
+    # upgraded on the next successful login after a change.
+    password_hash_time_cost: int = Field(default=2, ge=1, description="argon2id iterations")
+    password_hash_memory_cost: int = Field(default=19456, ge=8, description="argon2id memory in KiB")
+    password_hash_parallelism: int = Field(default=1, ge=1, description="argon2id lanes")
+    password_hash_workers: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Threads dedicated to password hashing (defaults to CPU count)",
     )
 
     # Qdrant
@@ -107,6 +126,14 @@ class Settings(BaseSettings):
             raise ValueError("Database URL must use postgresql:// or postgresql+asyncpg://")
         return v
 
+    @field_validator("algorithm")
+    @classmethod
+    def validate_algorithm(cls, v: str) -> str:
+        """Only HMAC algorithms are supported - there is no key pair to sign with."""
+        if v not in ("HS256", "HS384", "HS512"):
+            raise ValueError("JWT algorithm must be HS256, HS384 or HS512")
+        return v
+
     @property
     def database_url_str(self) -> str:
         """Get database URL as string."""
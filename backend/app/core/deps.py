@@ -1,45 +1,80 @@
 """
 Dependencies for FastAPI routes.
 """
-from typing import Annotated, Optional
+import hashlib
+from typing import Annotated, Any, NamedTuple, Optional
 
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError
-from sqlalchemy import select
+from jwt import InvalidTokenError
+from sqlalchemy import inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import family_cache, user_flags_cache
 from app.core.security import decode_token
 from app.db.base import get_db
+from app.models.family import Family
 from app.models.user import User
 
 # HTTP Bearer security scheme for JWT tokens
 # auto_error=False allows endpoints to handle missing tokens gracefully
 security = HTTPBearer(auto_error=False)
 
+# Short-lived cache of user column values keyed by access-token hash.
+# Skips the per-request user SELECT; the TTL bounds how long a deactivated
+# user keeps access.
+USER_CACHE_TTL_SECONDS = 30
+_user_cache: TTLCache[str, dict[str, Any]] = TTLCache(
+    maxsize=10_000,
+    ttl=USER_CACHE_TTL_SECONDS,
+)
+_USER_COLUMNS = tuple(attr.key for attr in inspect(User).column_attrs)
 
-async def get_current_user(
+
+class UserFlags(NamedTuple):
+    """The authenticated user's id and access flags, without the profile columns."""
+
+    id: int
+    is_active: bool
+    is_superuser: bool
+
+
+def _token_cache_key(token: str) -> str:
+    """Hash token so raw credentials are never held in the cache."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def _user_snapshot(user: User) -> dict[str, Any]:
+    """Capture a user's column values for caching."""
+    return {key: getattr(user, key) for key in _USER_COLUMNS}
+
+
+def _credentials_exception() -> HTTPException:
+    """401 raised for any missing or invalid access token."""
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+async def get_token_payload(
     credentials: Annotated[Optional[HTTPAuthorizationCredentials], Depends(security)],
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> User:
+) -> dict[str, Any]:
     """
-    Get current authenticated user from JWT token.
+    Decode and validate the bearer access token without touching the database.
 
     Args:
         credentials: HTTP Bearer token (optional)
-        db: Database session
 
     Returns:
-        Current user
+        Decoded token payload with an integer-convertible "sub"
 
     Raises:
-        HTTPException: If token is invalid or user not found
+        HTTPException: If token is missing, invalid or not an access token
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+    credentials_exception = _credentials_exception()
 
     if credentials is None:
         raise credentials_exception
@@ -61,11 +96,11 @@ async def get_current_user(
 
         # Convert user_id to int
         try:
-            user_id_int = int(user_id)
+            int(user_id)
         except (ValueError, TypeError):
             raise credentials_exception
 
-    except JWTError as e:
+    except InvalidTokenError as e:
         # Log the actual JWT error for debugging
         import logging
         logger = logging.getLogger(__name__)
@@ -78,18 +113,53 @@ async def get_current_user(
         logger.debug(f"Token validation error: {str(e)}")
         raise credentials_exception
 
-    # Get user from database
-    try:
-        result = await db.execute(select(User).where(User.id == user_id_int))
-        user = result.scalar_one_or_none()
-    except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.debug(f"Database query error: {str(e)}")
-        raise credentials_exception
+    return payload
 
-    if user is None:
-        raise credentials_exception
+
+async def get_current_user(
+    credentials: Annotated[Optional[HTTPAuthorizationCredentials], Depends(security)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> User:
+    """
+    Get current authenticated user from JWT token.
+
+    Args:
+        credentials: HTTP Bearer token (optional)
+        db: Database session
+
+    Returns:
+        Current user with every column loaded
+
+    Raises:
+        HTTPException: If token is invalid or user not found
+    """
+    credentials_exception = _credentials_exception()
+
+    payload = await get_token_payload(credentials)
+    token = credentials.credentials
+    user_id_int = int(payload["sub"])
+
+    # Serve from cache - each request gets its own transient User instance
+    cache_key = _token_cache_key(token)
+    snapshot = _user_cache.get(cache_key)
+    if snapshot is not None and snapshot["id"] == user_id_int:
+        user = User(**snapshot)
+    else:
+        # Get user from database
+        try:
+            result = await db.execute(select(User).where(User.id == user_id_int))
+            user = result.scalar_one_or_none()
+        except Exception as e:
+            import logging
+            logger = logging.getLogger(__name__)
+            logger.debug(f"Database query error: {str(e)}")
+            raise credentials_exception
+
+        if user is None:
+            raise credentials_exception
+
+        _user_cache[cache_key] = _user_snapshot(user)
+        await user_flags_cache.set(user.id, user.is_active, user.is_superuser)
 
     if not user.is_active:
         raise HTTPException(
@@ -100,27 +170,51 @@ async def get_current_user(
     return user
 
 
-async def get_current_active_user(
-    current_user: Annotated[User, Depends(get_current_user)],
-) -> User:
+async def get_current_user_flags(
+    payload: Annotated[dict[str, Any], Depends(get_token_payload)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> UserFlags:
     """
-    Get current active user.
+    Get the current user's id and access flags via the shared Redis cache.
+
+    For handlers that only need to know who the caller is; handlers that read
+    profile columns use get_current_user instead.
 
     Args:
-        current_user: Current user from token
+        payload: Validated access token payload
+        db: Database session
 
     Returns:
-        Active user
+        UserFlags for the token's subject
 
     Raises:
-        HTTPException: If user is inactive
+        HTTPException: If the user no longer exists or is inactive
     """
-    if not current_user.is_active:
+    user_id = int(payload["sub"])
+
+    flags = await user_flags_cache.get(user_id)
+    if flags is None:
+        result = await db.execute(
+            select(User.is_active, User.is_superuser).where(User.id == user_id)
+        )
+        row = result.one_or_none()
+        if row is None:
+            raise _credentials_exception()
+        flags = {"is_active": row.is_active, "is_superuser": row.is_superuser}
+        await user_flags_cache.set(user_id, row.is_active, row.is_superuser)
+
+    if not flags["is_active"]:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Inactive user",
         )
-    return current_user
+
+    return UserFlags(id=user_id, **flags)
+
+
+# get_current_user already rejects inactive users, so the "active" dependency is
+# the same callable - FastAPI then resolves it once per request for both aliases
+get_current_active_user = get_current_user
 
 
 async def get_current_superuser(
@@ -146,8 +240,81 @@ async def get_current_superuser(
     return current_user
 
 
+async def get_current_family_id(
+    current_user: Annotated[UserFlags, Depends(get_current_user_flags)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> Optional[int]:
+    """
+    Get the current user's family id via the Redis read-through cache.
+
+    Args:
+        current_user: Current active user
+        db: Database session
+
+    Returns:
+        Family ID, or None if the user has no family yet
+    """
+    async def load_family_id() -> Optional[int]:
+        result = await db.execute(
+            select(Family.id).where(Family.owner_id == current_user.id)
+        )
+        return result.scalar_one_or_none()
+
+    return await family_cache.get_or_fetch(current_user.id, load_family_id)
+
+
+async def get_current_family_or_none(
+    current_user: Annotated[UserFlags, Depends(get_current_user_flags)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> Optional[Family]:
+    """
+    Get the current user's family profile, if any.
+
+    Args:
+        current_user: Current active user
+        db: Database session
+
+    Returns:
+        Family or None
+    """
+    result = await db.execute(
+        select(Family).where(Family.owner_id == current_user.id)
+    )
+    return result.scalar_one_or_none()
+
+
+async def get_current_family(
+    family: Annotated[Optional[Family], Depends(get_current_family_or_none)],
+) -> Family:
+    """
+    Get the current user's family profile.
+
+    Args:
+        family: Family from get_current_family_or_none
+
+    Returns:
+        Family
+
+    Raises:
+        HTTPException: If the user has no family profile
+    """
+    if family is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Family profile not found",
+        )
+    return family
+
+
 # Type aliases for common dependencies
+# FastAPI resolves each dependency once per request, so handlers and nested
+# dependencies sharing these aliases trigger a single lookup.
+TokenPayload = Annotated[dict[str, Any], Depends(get_token_payload)]
 CurrentUser = Annotated[User, Depends(get_current_user)]
-CurrentActiveUser = Annotated[User, Depends(get_current_active_user)]
+CurrentActiveUser = CurrentUser
+CurrentUserFlags = Annotated[UserFlags, Depends(get_current_user_flags)]
 CurrentSuperUser = Annotated[User, Depends(get_current_superuser)]
 DatabaseSession = Annotated[AsyncSession, Depends(get_db)]
+CurrentFamilyId = Annotated[Optional[int], Depends(get_current_family_id)]
+CurrentFamilyOrNone = Annotated[Optional[Family], Depends(get_current_family_or_none)]
+CurrentFamily = Annotated[Family, Depends(get_current_family)]
@@ -1,21 +1,145 @@
 """
 Security utilities for password hashing and JWT token management.
 """
-from datetime import datetime, timedelta, timezone
+import asyncio
+import base64
+import hashlib
+import hmac
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import lru_cache
 from typing import Any, Optional, Union
 
 import bcrypt
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import jwt
+import orjson
+from argon2 import PasswordHasher, Type
+from argon2.exceptions import InvalidHashError, VerificationError
+from cachetools import TLRUCache
+from jwt import InvalidTokenError
 
 from app.core.config import settings
 
-# Password hashing context
-# Use bcrypt directly to avoid passlib compatibility issues with bcrypt 5.x
-pwd_context = CryptContext(
-    schemes=["bcrypt"],
-    deprecated="auto",
+# Token settings bound once at import; decode_token runs on every request
+_SECRET_KEY = settings.secret_key.encode("utf-8")
+_ALGORITHM = settings.algorithm
+_ALGORITHMS = [settings.algorithm]
+_ACCESS_TOKEN_TTL_SECONDS = settings.access_token_expire_minutes * 60
+_REFRESH_TOKEN_TTL_SECONDS = settings.refresh_token_expire_days * 86400
+
+
+def _b64url(data: bytes) -> bytes:
+    """Unpadded base64url encoding used by JWS."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+# The algorithm is fixed for the process (settings only allow HS256/384/512),
+# so tokens are signed with a precomputed header segment and the prepared key.
+# PyJWT produces the identical header, so either side can verify the other.
+_HEADER = _b64url(orjson.dumps({"alg": _ALGORITHM, "typ": "JWT"}))
+_DIGEST = {
+    "HS256": hashlib.sha256,
+    "HS384": hashlib.sha384,
+    "HS512": hashlib.sha512,
+}[_ALGORITHM]
+
+
+def _encode_token(claims: dict[str, Any]) -> str:
+    """Sign claims into a compact JWT."""
+    signing_input = _HEADER + b"." + _b64url(orjson.dumps(claims))
+    signature = hmac.new(_SECRET_KEY, signing_input, _DIGEST).digest()
+    return (signing_input + b"." + _b64url(signature)).decode("ascii")
+
+
+def _b64url_decode(segment: bytes) -> bytes:
+    """Decode an unpadded base64url JWS segment."""
+    return base64.urlsafe_b64decode(segment + b"=" * (-len(segment) % 4))
+
+
+def _decode_hmac(token: str) -> Optional[dict[str, Any]]:
+    """
+    Verify a token minted by _encode_token without going through PyJWT.
+
+    Handles only our own header segment and payloads whose sole time claim is
+    an integer exp; returns None for anything else so the caller falls back to
+    jwt.decode.
+
+    Raises:
+        InvalidTokenError: If the signature, payload or exp claim is invalid
+    """
+    if not token.isascii() or token.count(".") != 2:
+        return None
+    raw = token.encode("ascii")
+    header, _, rest = raw.partition(b".")
+    if header != _HEADER:
+        return None
+
+    payload_segment, _, signature = rest.partition(b".")
+    expected = hmac.new(
+        _SECRET_KEY, header + b"." + payload_segment, _DIGEST
+    ).digest()
+    try:
+        if not hmac.compare_digest(expected, _b64url_decode(signature)):
+            raise jwt.InvalidSignatureError("Signature verification failed")
+        payload = orjson.loads(_b64url_decode(payload_segment))
+    except (ValueError, TypeError) as e:
+        raise jwt.DecodeError("Invalid token encoding") from e
+
+    if not isinstance(payload, dict) or "nbf" in payload or "iat" in payload:
+        return None
+
+    if "exp" in payload:
+        exp = payload["exp"]
+        if type(exp) is not int:
+            # Floats, bools and null are left to PyJWT's own exp rules
+            return None
+        if exp <= time.time():
+            raise jwt.ExpiredSignatureError("Signature has expired")
+
+    return payload
+
+
+# Password hasher: argon2id with cost parameters from settings.
+# Legacy bcrypt hashes are verified with bcrypt directly until users log in again.
+password_hasher = PasswordHasher(
+    time_cost=settings.password_hash_time_cost,
+    memory_cost=settings.password_hash_memory_cost,
+    parallelism=settings.password_hash_parallelism,
+    type=Type.ID,
+)
+
+# Dedicated pool for password hashing, sized to the CPU count. argon2 and bcrypt
+# release the GIL, so hashes run in parallel across cores, and a login flood
+# queues here instead of competing with other blocking work for threads.
+_HASH_POOL = ThreadPoolExecutor(
+    max_workers=settings.password_hash_workers or os.cpu_count(),
+    thread_name_prefix="password-hash",
+)
+
+# Verified token payloads keyed by blake2b(token), so repeat requests with the
+# same token skip the HMAC check and JSON parse. Entries live for at most
+# TOKEN_CACHE_TTL_SECONDS and never past the token's own "exp".
+TOKEN_CACHE_TTL_SECONDS = 60
+
+
+def _token_expiry(key: bytes, payload: dict[str, Any], now: float) -> float:
+    """Cache expiry (monotonic clock) for a decoded payload."""
+    remaining = TOKEN_CACHE_TTL_SECONDS
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        remaining = min(remaining, exp - time.time())
+    return now + remaining
+
+
+_token_cache: TLRUCache[bytes, dict[str, Any]] = TLRUCache(
+    maxsize=10_000,
+    ttu=_token_expiry,
 )
+# cachetools caches aren't thread-safe; decode_token may also run in worker threads
+_token_cache_lock = threading.Lock()
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -29,27 +153,106 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
+    if hashed_password.startswith("$2"):
+        # Legacy bcrypt hash
+        try:
+            return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
+        except ValueError:
+            return False
+
+    try:
+        return password_hasher.verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Check whether a stored hash should be replaced with a fresh argon2id hash.
+
+    Args:
+        hashed_password: Hashed password from database
+
+    Returns:
+        True for legacy bcrypt hashes or argon2 hashes with outdated parameters
+    """
+    if hashed_password.startswith("$2"):
+        return True
     try:
-        # Use bcrypt directly to avoid passlib initialization issues
-        return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
-    except Exception:
-        # Fallback to passlib if direct bcrypt fails
-        return pwd_context.verify(plain_password, hashed_password)
+        return password_hasher.check_needs_rehash(hashed_password)
+    except InvalidHashError:
+        return False
 
 
 def get_password_hash(password: str) -> str:
     """
     Hash a password for storing in database.
 
+    Uses argon2id. CPU-bound - use aget_password_hash from async code.
+
     Args:
         password: Plain text password
 
     Returns:
         Hashed password
     """
-    # Use bcrypt directly to avoid passlib initialization issues
-    hashed = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
-    return hashed.decode('utf-8')
+    return password_hasher.hash(password)
+
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password on the hashing pool without blocking the event loop.
+
+    Args:
+        plain_password: Plain text password
+        hashed_password: Hashed password from database
+
+    Returns:
+        True if password matches, False otherwise
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _HASH_POOL, verify_password, plain_password, hashed_password
+    )
+
+
+@lru_cache(maxsize=1)
+def _dummy_password_hash() -> str:
+    """Hash with current parameters, used to equalize timing for unknown users."""
+    return get_password_hash("compass-dummy-password")
+
+
+def _verify_dummy_password(plain_password: str) -> None:
+    """Verify against the dummy hash (built lazily on the hashing pool)."""
+    verify_password(plain_password, _dummy_password_hash())
+
+
+async def averify_dummy_password(plain_password: str) -> None:
+    """
+    Spend one password verification when the account doesn't exist.
+
+    Makes "unknown email" cost the same single hash as "wrong password", so
+    login timing doesn't reveal which emails are registered.
+
+    Args:
+        plain_password: Plain text password from the request
+    """
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(_HASH_POOL, _verify_dummy_password, plain_password)
+
+
+async def aget_password_hash(password: str) -> str:
+    """
+    Hash a password on the hashing pool without blocking the event loop.
+
+    Args:
+        password: Plain text password
+
+    Returns:
+        Hashed password
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_HASH_POOL, get_password_hash, password)
 
 
 def create_access_token(
@@ -76,12 +279,8 @@ def create_access_token(
         )
         ```
     """
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(
-            minutes=settings.access_token_expire_minutes
-        )
+    ttl_seconds = expires_delta.total_seconds() if expires_delta else _ACCESS_TOKEN_TTL_SECONDS
+    expire = int(time.time() + ttl_seconds)
 
     to_encode: dict[str, Any] = {
         "exp": expire,
@@ -92,12 +291,7 @@ def create_access_token(
     if additional_claims:
         to_encode.update(additional_claims)
 
-    encoded_jwt = jwt.encode(
-        to_encode,
-        settings.secret_key,
-        algorithm=settings.algorithm,
-    )
-    return encoded_jwt
+    return _encode_token(to_encode)
 
 
 def create_refresh_token(
@@ -114,12 +308,8 @@ def create_refresh_token(
     Returns:
         Encoded JWT refresh token
     """
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(
-            days=settings.refresh_token_expire_days
-        )
+    ttl_seconds = expires_delta.total_seconds() if expires_delta else _REFRESH_TOKEN_TTL_SECONDS
+    expire = int(time.time() + ttl_seconds)
 
     to_encode = {
         "exp": expire,
@@ -127,18 +317,16 @@ def create_refresh_token(
         "type": "refresh",
     }
 
-    encoded_jwt = jwt.encode(
-        to_encode,
-        settings.secret_key,
-        algorithm=settings.algorithm,
-    )
-    return encoded_jwt
+    return _encode_token(to_encode)
 
 
 def decode_token(token: str) -> dict[str, Any]:
     """
     Decode and verify a JWT token.
 
+    Valid payloads are cached until the token expires (capped at
+    TOKEN_CACHE_TTL_SECONDS); invalid tokens are never cached.
+
     Args:
         token: JWT token to decode
 
@@ -146,21 +334,31 @@ def decode_token(token: str) -> dict[str, Any]:
         Decoded token payload
 
     Raises:
-        JWTError: If token is invalid or expired
+        InvalidTokenError: If token is invalid or expired
     """
     if not token:
-        raise JWTError("Token is empty")
+        raise InvalidTokenError("Token is empty")
+
+    cache_key = hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+    with _token_cache_lock:
+        cached = _token_cache.get(cache_key)
+    if cached is not None:
+        return dict(cached)
 
     try:
-        payload = jwt.decode(
-            token,
-            settings.secret_key,
-            algorithms=[settings.algorithm],
-        )
-        return payload
-    except JWTError as e:
-        # Re-raise the original JWTError without wrapping
+        payload = _decode_hmac(token)
+        if payload is None:
+            payload = jwt.decode(
+                token,
+                _SECRET_KEY,
+                algorithms=_ALGORITHMS,
+            )
+        with _token_cache_lock:
+            _token_cache[cache_key] = payload
+        return dict(payload)
+    except InvalidTokenError as e:
+        # Re-raise the original InvalidTokenError without wrapping
         raise e
     except Exception as e:
         # Catch any other unexpected errors
-        raise JWTError(f"Could not validate credentials: {str(e)}") from e
+        raise InvalidTokenError(f"Could not validate credentials: {str(e)}") from e
@@ -3,32 +3,90 @@ Database connection and session management.
 """
 from collections.abc import AsyncGenerator
 from typing import Any
+from uuid import uuid4
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.pool import NullPool
+from sqlalchemy.orm import ORMExecuteState, Session, raiseload
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 
 from app.core.config import settings
 from app.models.base import Base
 
+# Connection pool (tests and PgBouncer use NullPool)
+# LIFO reuse keeps a small hot set of connections and lets idle ones time out;
+# pre_ping discards connections the server has closed before handing them out.
+# Behind PgBouncer the bouncer does the pooling, so a second pool here would
+# only pin server connections.
+pool_kwargs: dict[str, Any] = (
+    {"poolclass": NullPool}
+    if settings.environment == "test" or settings.database_pgbouncer
+    else {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": settings.database_pool_size,
+        "max_overflow": settings.database_max_overflow,
+        "pool_timeout": settings.database_pool_timeout,
+        "pool_recycle": settings.database_pool_recycle,
+        "pool_pre_ping": settings.database_pool_pre_ping,
+        "pool_use_lifo": True,
+    }
+)
+
+connect_args: dict[str, Any] = {}
+if settings.environment == "development":
+    connect_args["ssl"] = False  # Disable SSL for local development
+if settings.database_pgbouncer:
+    # Transaction-mode PgBouncer may hand each transaction a different server
+    # connection, so named prepared statements cannot be reused: turn off both
+    # asyncpg's and SQLAlchemy's statement caches and use unique names.
+    # The compiled-SQL cache (query_cache_size) is unaffected.
+    connect_args["statement_cache_size"] = 0
+    connect_args["prepared_statement_cache_size"] = 0
+    connect_args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid4()}__"
+
 # Create async engine
 engine = create_async_engine(
     settings.database_url_str,
     echo=settings.database_echo,
-    poolclass=NullPool if settings.environment == "test" else None,
     future=True,
-    connect_args={
-        "ssl": False,  # Disable SSL for local development
-    } if settings.environment == "development" else {},
+    query_cache_size=1200,  # Compiled-statement cache (default 500)
+    **pool_kwargs,
+    connect_args=connect_args,
 )
 
+
+class LazyLoadGuardSession(Session):
+    """Session that refuses implicit lazy loads (debug mode only)."""
+
+
+@event.listens_for(LazyLoadGuardSession, "do_orm_execute")
+def _raise_on_lazy_load(orm_execute_state: ORMExecuteState) -> None:
+    """
+    Make every relationship not explicitly eager-loaded raise on access.
+
+    Catches N+1 regressions in development with a clear error naming the
+    relationship, instead of per-row queries (or MissingGreenlet under async).
+    Identity-map hits that need no SQL are still allowed.
+    """
+    if (
+        orm_execute_state.is_select
+        and not orm_execute_state.is_column_load
+        and not orm_execute_state.is_relationship_load
+    ):
+        orm_execute_state.statement = orm_execute_state.statement.options(
+            raiseload("*", sql_only=True)
+        )
+
+
 # Create async session maker
 AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
+    sync_session_class=LazyLoadGuardSession if settings.debug else Session,
     expire_on_commit=False,
     autocommit=False,
     autoflush=False,
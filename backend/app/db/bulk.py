@@ -0,0 +1,158 @@
+"""
+Bulk loaders for scraper ingestion.
+
+Uses asyncpg's binary COPY instead of one ORM INSERT per row: straight into
+activities for rows known to be new, or into a temp staging table followed
+by a single INSERT ... ON CONFLICT when rows may already exist.
+"""
+import json
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Columns loaded via COPY (id and timestamps come from table defaults)
+ACTIVITY_COPY_COLUMNS = (
+    "provider_id",
+    "venue_id",
+    "name",
+    "description",
+    "activity_type",
+    "start_date",
+    "end_date",
+    "start_time",
+    "end_time",
+    "rrule",
+    "days_of_week",
+    "min_age",
+    "max_age",
+    "age_range_text",
+    "price_cents",
+    "price_text",
+    "has_scholarship",
+    "registration_url",
+    "registration_deadline",
+    "registration_status",
+    "max_participants",
+    "attributes",
+    "canon_hash",
+    "source_url",
+    "last_verified",
+    "is_active",
+)
+
+# asyncpg encodes jsonb from text, so these are serialized before COPY
+_JSONB_COLUMNS = frozenset({"days_of_week", "attributes"})
+
+# Defaults for NOT NULL columns that COPY would otherwise receive as NULL
+_COLUMN_DEFAULTS: dict[str, Any] = {"has_scholarship": False, "is_active": True}
+
+_COLUMN_LIST = ", ".join(ACTIVITY_COPY_COLUMNS)
+_UPDATE_SET = ", ".join(
+    f"{column} = EXCLUDED.{column}"
+    for column in ACTIVITY_COPY_COLUMNS
+    if column != "canon_hash"
+)
+
+_CREATE_STAGING_SQL = (
+    "CREATE TEMP TABLE IF NOT EXISTS staging_activities "
+    "(LIKE activities INCLUDING DEFAULTS) ON COMMIT DROP"
+)
+_UPSERT_SQL = (
+    f"INSERT INTO activities ({_COLUMN_LIST}) "
+    f"SELECT {_COLUMN_LIST} FROM staging_activities "
+    f"ON CONFLICT (canon_hash) DO UPDATE SET {_UPDATE_SET}, updated_at = now()"
+)
+
+
+def _to_record(row: dict[str, Any]) -> tuple[Any, ...]:
+    """Convert an activity dict into a COPY record in ACTIVITY_COPY_COLUMNS order."""
+    record = []
+    for column in ACTIVITY_COPY_COLUMNS:
+        value = row.get(column, _COLUMN_DEFAULTS.get(column))
+        if value is not None and column in _JSONB_COLUMNS:
+            value = json.dumps(value)
+        record.append(value)
+    return tuple(record)
+
+
+async def _driver_connection(db: AsyncSession) -> Any:
+    """Return the asyncpg connection behind the session's current transaction."""
+    connection = await db.connection()
+    raw_connection = await connection.get_raw_connection()
+    return raw_connection.driver_connection
+
+
+async def copy_activities(
+    db: AsyncSession,
+    rows: Sequence[dict[str, Any]],
+) -> int:
+    """
+    Insert new activities with a single binary COPY.
+
+    No staging table and no ON CONFLICT, so rows must already be
+    de-duplicated against the table (a canon_hash conflict fails the whole
+    COPY). Runs in the session's transaction; the caller commits.
+
+    Args:
+        db: Database session
+        rows: Activity dicts keyed by column name; must include provider_id,
+            name and canon_hash. Keys outside ACTIVITY_COPY_COLUMNS are ignored.
+
+    Returns:
+        Number of rows inserted
+    """
+    records = [_to_record(row) for row in rows]
+    if not records:
+        return 0
+
+    driver_connection = await _driver_connection(db)
+    status = await driver_connection.copy_records_to_table(
+        "activities",
+        records=records,
+        columns=ACTIVITY_COPY_COLUMNS,
+    )
+
+    # Command tag is "COPY <count>"
+    return int(status.rsplit(" ", 1)[-1])
+
+
+async def bulk_upsert_activities(
+    db: AsyncSession,
+    rows: Iterable[dict[str, Any]],
+) -> int:
+    """
+    Upsert activities in bulk using COPY + INSERT ... ON CONFLICT (canon_hash).
+
+    Runs on the session's connection (inside a savepoint if a transaction is
+    already open), so the caller still controls commit/rollback.
+
+    Args:
+        db: Database session
+        rows: Activity dicts keyed by column name; must include provider_id,
+            name and canon_hash
+
+    Returns:
+        Number of rows inserted or updated
+    """
+    # ON CONFLICT cannot touch the same row twice in one statement, so keep
+    # only the last row per canon_hash
+    deduped = {row["canon_hash"]: row for row in rows}
+    records = [_to_record(row) for row in deduped.values()]
+    if not records:
+        return 0
+
+    driver_connection = await _driver_connection(db)
+
+    async with driver_connection.transaction():
+        await driver_connection.execute(_CREATE_STAGING_SQL)
+        await driver_connection.execute("TRUNCATE staging_activities")
+        await driver_connection.copy_records_to_table(
+            "staging_activities",
+            records=records,
+            columns=ACTIVITY_COPY_COLUMNS,
+        )
+        status = await driver_connection.execute(_UPSERT_SQL)
+
+    # Command tag is "INSERT 0 <count>"
+    return int(status.rsplit(" ", 1)[-1])
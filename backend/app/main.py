@@ -4,14 +4,20 @@ Compass - AI-powered children's enrichment activity advisor.
 Main FastAPI application.
 """
 import logging
+import random
+import ssl
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from jwt import InvalidTokenError
+from sqlalchemy.exc import SQLAlchemyError
 
 from app.api.endpoints import activities, auth, children, families, recommendations
+from app.core.cache import redis_client
 from app.core.config import settings
 from app.db.base import close_db, init_db
 
@@ -34,6 +40,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("Starting Compass application...")
     logger.info(f"Environment: {settings.environment}")
     logger.info(f"Debug mode: {settings.debug}")
+    # HS256 verification runs on OpenSSL's SHA-256 (SHA-NI where the CPU has it)
+    logger.info(f"OpenSSL: {ssl.OPENSSL_VERSION}")
+
+    # Database connections are opened lazily by app.db.base. With
+    # DATABASE_PGBOUNCER=true the engine skips local pooling and prepared
+    # statement caching so DATABASE_URL can point at PgBouncer in transaction mode.
 
     # Initialize database (only in development/testing)
     # Note: In production, use Alembic migrations instead
@@ -46,6 +58,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Shutdown
     logger.info("Shutting down Compass application...")
     await close_db()
+    await redis_client.aclose()
 
 
 # Create FastAPI app
@@ -54,6 +67,7 @@ app = FastAPI(
     version=settings.app_version,
     description="AI-powered children's enrichment activity advisor for parents",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/api/docs" if settings.debug else None,
     redoc_url="/api/redoc" if settings.debug else None,
 )
@@ -65,23 +79,29 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Paging cursor and cache validator must be readable by browser clients
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
 
 
+# The health payload only changes with a deploy, so it is serialized once
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "app": settings.app_name,
+    "version": settings.app_version,
+    "environment": settings.environment,
+})
+
+
 # Health check endpoint
 @app.get("/health", tags=["health"])
-async def health_check() -> dict[str, str]:
+async def health_check() -> Response:
     """
     Health check endpoint.
 
     Returns application status and version.
     """
-    return {
-        "status": "healthy",
-        "app": settings.app_name,
-        "version": settings.app_version,
-        "environment": settings.environment,
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 # Include routers
@@ -92,18 +112,21 @@ app.include_router(activities.router, prefix=settings.api_v1_prefix)
 app.include_router(recommendations.router, prefix=settings.api_v1_prefix)
 
 
-# Global exception handler
-@app.exception_handler(Exception)
-async def global_exception_handler(request, exc: Exception) -> JSONResponse:
+def _log_unhandled(kind: str, exc: Exception) -> None:
     """
-    Global exception handler for unhandled errors.
+    Log an unhandled error as one line, with a traceback only for a sample.
 
-    Logs the error and returns a generic error response.
+    Formatting full tracebacks for every failure is costly under error storms;
+    debug mode always includes them.
     """
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
+    exc_info = settings.debug or random.random() < settings.error_traceback_sample_rate
+    logger.error(f"{kind}: {type(exc).__name__}: {exc}", exc_info=exc_info)
+
 
+def _internal_error_response(exc: Exception) -> ORJSONResponse:
+    """Generic 500 response (with error details in debug mode)."""
     if settings.debug:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "detail": "Internal server error",
@@ -112,12 +135,42 @@ async def global_exception_handler(request, exc: Exception) -> JSONResponse:
             },
         )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"detail": "Internal server error"},
     )
 
 
+@app.exception_handler(InvalidTokenError)
+async def invalid_token_handler(request, exc: InvalidTokenError) -> ORJSONResponse:
+    """Treat token errors that escape the auth dependencies as 401s."""
+    logger.debug(f"Invalid token: {exc}")
+    return ORJSONResponse(
+        status_code=401,
+        content={"detail": "Could not validate credentials"},
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+@app.exception_handler(SQLAlchemyError)
+async def database_exception_handler(request, exc: SQLAlchemyError) -> ORJSONResponse:
+    """Handle database errors with a short log line."""
+    _log_unhandled("Database error", exc)
+    return _internal_error_response(exc)
+
+
+# Global exception handler
+@app.exception_handler(Exception)
+async def global_exception_handler(request, exc: Exception) -> ORJSONResponse:
+    """
+    Global exception handler for unhandled errors.
+
+    Logs the error and returns a generic error response.
+    """
+    _log_unhandled("Unhandled exception", exc)
+    return _internal_error_response(exc)
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -6,7 +6,7 @@ Activity model for enrichment activities.
 from datetime import date, time
 from typing import TYPE_CHECKING, Any, Optional
 
-from sqlalchemy import Date, ForeignKey, Integer, Numeric, String, Text, Time
+from sqlalchemy import Date, Enum, ForeignKey, Index, Integer, Numeric, String, Text, Time, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -16,6 +16,8 @@ if TYPE_CHECKING:
     from app.models.provider import Provider
     from app.models.venue import Venue
 
+REGISTRATION_STATUSES = ("open", "closed", "waitlist", "full")
+
 
 class Activity(Base, TimestampMixin):
     """
@@ -25,6 +27,18 @@ class Activity(Base, TimestampMixin):
     """
 
     __tablename__ = "activities"
+    __table_args__ = (
+        # Keyset pagination: WHERE is_active = ? AND id > ? ORDER BY id
+        Index("idx_activities_active_id", "is_active", "id"),
+        # list_activities filters on the default is_active = true path
+        Index(
+            "idx_activities_active_type_age",
+            "activity_type",
+            "min_age",
+            "max_age",
+            postgresql_where=text("is_active = true"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
 
@@ -96,8 +110,9 @@ class Activity(Base, TimestampMixin):
     # Registration
     registration_url: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     registration_deadline: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+    # Native PG enum: 4 bytes per row, compared as an integer
     registration_status: Mapped[Optional[str]] = mapped_column(
-        String(20),
+        Enum(*REGISTRATION_STATUSES, name="registration_status"),
         nullable=True,
         comment="open, closed, waitlist, full",
     )
@@ -125,8 +140,7 @@ class Activity(Base, TimestampMixin):
     canon_hash: Mapped[str] = mapped_column(
         String(64),
         nullable=False,
-        index=True,
-        unique=True,
+        unique=True,  # Unique constraint's index serves lookups; no separate index
         comment="SHA256 hash for de-duplication (normalized name + fuzzy date ±3 + geohash6 + org)",
     )
 
@@ -6,7 +6,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Any, Optional
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import DateTime, Index, event, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -23,7 +23,6 @@ class TimestampMixin:
         DateTime(timezone=True),
         server_default=func.now(),
         nullable=False,
-        index=True,
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -33,6 +32,23 @@ class TimestampMixin:
     )
 
 
+@event.listens_for(TimestampMixin, "instrument_class", propagate=True)
+def _add_created_at_brin_index(mapper: Any, cls: type) -> None:
+    """
+    Index created_at with BRIN.
+
+    created_at only ever grows with insertion order, so a BRIN index answers
+    range scans at a fraction of a B-tree's size.
+    """
+    table = cls.__table__
+    Index(
+        f"ix_{table.name}_created_at",
+        table.c.created_at,
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+    )
+
+
 class SoftDeleteMixin:
     """Mixin for soft delete functionality."""
 
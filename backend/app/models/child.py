@@ -6,7 +6,7 @@ Child profile model with temperament, goals, and constraints.
 from datetime import date
 from typing import TYPE_CHECKING, Any, Optional
 
-from sqlalchemy import Date, ForeignKey, Integer, String, Text
+from sqlalchemy import Date, ForeignKey, Index, Integer, String, Text, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -45,6 +45,14 @@ class ChildProfile(Base, TimestampMixin, SoftDeleteMixin):
     """
 
     __tablename__ = "child_profiles"
+    __table_args__ = (
+        # Children are always listed/fetched by family excluding soft-deleted rows
+        Index(
+            "idx_child_profiles_family_active",
+            "family_id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     family_id: Mapped[int] = mapped_column(
@@ -131,8 +139,8 @@ class ChildProfile(Base, TimestampMixin, SoftDeleteMixin):
     @property
     def age(self) -> int:
         """Calculate current age from birth date."""
-        from datetime import datetime
-        today = datetime.now().date()
-        return today.year - self.birth_date.year - (
-            (today.month, today.day) < (self.birth_date.month, self.birth_date.day)
+        today = date.today()
+        birth_date = self.birth_date
+        return today.year - birth_date.year - (
+            (today.month, today.day) < (birth_date.month, birth_date.day)
         )
@@ -6,7 +6,7 @@ Family model for household profile.
 from typing import TYPE_CHECKING, Optional
 
 from geoalchemy2 import Geography
-from sqlalchemy import ForeignKey, Integer, Numeric, String, Text
+from sqlalchemy import ForeignKey, Index, Integer, Numeric, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin
@@ -25,6 +25,11 @@ class Family(Base, TimestampMixin):
     """
 
     __tablename__ = "families"
+    __table_args__ = (
+        # SP-GiST point index backing ST_DWithin radius lookups; declared here
+        # (with spatial_index=False below) so create_all matches migration 004
+        Index("idx_families_location", "location", postgresql_using="spgist"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     owner_id: Mapped[int] = mapped_column(
@@ -35,7 +40,7 @@ class Family(Base, TimestampMixin):
 
     # Location (PostGIS Point)
     location: Mapped[Optional[str]] = mapped_column(
-        Geography(geometry_type="POINT", srid=4326),
+        Geography(geometry_type="POINT", srid=4326, spatial_index=False),
         nullable=True,
     )
     address: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
@@ -65,10 +70,13 @@ class Family(Base, TimestampMixin):
 
     # Relationships
     owner: Mapped["User"] = relationship("User", back_populates="family")
+    # passive_deletes: child_profiles.family_id is ON DELETE CASCADE, so deleting
+    # a family leaves the children to the database instead of loading them first
     children: Mapped[list["ChildProfile"]] = relationship(
         "ChildProfile",
         back_populates="family",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     def __repr__(self) -> str:
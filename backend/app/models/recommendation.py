@@ -6,7 +6,8 @@ Recommendation model for storing child-specific activity recommendations.
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Optional
 
-from sqlalchemy import DateTime, ForeignKey, Integer, Numeric, Text
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Integer, SmallInteger, Text, text
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -16,6 +17,29 @@ if TYPE_CHECKING:
     from app.models.activity import Activity
     from app.models.child import ChildProfile
 
+RECOMMENDATION_TIERS = ("primary", "budget_saver", "stretch")
+
+
+class ScaledScore(TypeDecorator):
+    """
+    0-100 score with two decimals, stored as SMALLINT hundredths (0-10000).
+
+    Fixed-width 2-byte ints keep rows narrow, sort/compare faster than NUMERIC
+    and load as floats instead of Decimal. Scaling preserves ordering, so
+    ORDER BY and indexes work on the stored value directly.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[float], dialect: Any) -> Optional[int]:
+        """Scale to hundredths for storage."""
+        return None if value is None else round(value * 100)
+
+    def process_result_value(self, value: Optional[int], dialect: Any) -> Optional[float]:
+        """Scale back to a float score."""
+        return None if value is None else value / 100
+
 
 class Recommendation(Base, TimestampMixin):
     """
@@ -25,6 +49,14 @@ class Recommendation(Base, TimestampMixin):
     """
 
     __tablename__ = "recommendations"
+    __table_args__ = (
+        # A child's recommendations ordered by score, without a sort step
+        Index(
+            "idx_recommendations_child_score",
+            "child_profile_id",
+            text("total_score DESC"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
 
@@ -38,7 +70,6 @@ class Recommendation(Base, TimestampMixin):
     child_profile_id: Mapped[int] = mapped_column(
         ForeignKey("child_profiles.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     activity_id: Mapped[int] = mapped_column(
         ForeignKey("activities.id", ondelete="CASCADE"),
@@ -48,25 +79,24 @@ class Recommendation(Base, TimestampMixin):
 
     # Scoring (0-100 scale)
     total_score: Mapped[float] = mapped_column(
-        Numeric(5, 2),
+        ScaledScore(),
         nullable=False,
-        index=True,
         comment="Total recommendation score (0-100)",
     )
 
     # Score breakdown
     fit_score: Mapped[float] = mapped_column(
-        Numeric(5, 2),
+        ScaledScore(),
         nullable=False,
         comment="Fit score component (50% weight)",
     )
     practical_score: Mapped[float] = mapped_column(
-        Numeric(5, 2),
+        ScaledScore(),
         nullable=False,
         comment="Practical score component (30% weight)",
     )
     goals_score: Mapped[float] = mapped_column(
-        Numeric(5, 2),
+        ScaledScore(),
         nullable=False,
         comment="Goals alignment score (20% weight)",
     )
@@ -103,8 +133,9 @@ class Recommendation(Base, TimestampMixin):
     )
 
     # Recommendation tier
+    # Native PG enum: 4 bytes per row, compared as an integer
     tier: Mapped[str] = mapped_column(
-        Text,
+        Enum(*RECOMMENDATION_TIERS, name="recommendation_tier"),
         nullable=False,
         index=True,
         comment="primary, budget_saver, stretch",
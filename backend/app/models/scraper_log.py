@@ -6,13 +6,22 @@ Scraper log model for tracking scraper runs and quality metrics.
 from datetime import datetime
 from typing import Any, Optional
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Computed, DateTime, Enum, Float, ForeignKey, Index, Integer, Text, false, func, select, text
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin
 from app.models.provider import Provider
 
+SCRAPER_TYPES = ("ics", "rss", "html", "json", "csv")
+SCRAPER_STATUSES = ("success", "failed", "partial")
+
+# Runs below this pass rate count toward demotion
+DEMOTION_PASS_RATE = 85.0
+# Consecutive failing runs before a provider is demoted
+DEMOTION_CONSECUTIVE_RUNS = 2
+
 
 class ScraperLog(Base, TimestampMixin):
     """
@@ -22,6 +31,15 @@ class ScraperLog(Base, TimestampMixin):
     """
 
     __tablename__ = "scraper_logs"
+    __table_args__ = (
+        # Latest runs per provider (providers_to_demote); also serves the
+        # provider_id foreign key
+        Index(
+            "idx_scraper_logs_provider_run",
+            "provider_id",
+            text("run_started_at DESC"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
 
@@ -29,12 +47,12 @@ class ScraperLog(Base, TimestampMixin):
     provider_id: Mapped[int] = mapped_column(
         ForeignKey("providers.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
     # Run details
+    # Native PG enums: 4 bytes per row, compared as integers
     scraper_type: Mapped[str] = mapped_column(
-        String(20),
+        Enum(*SCRAPER_TYPES, name="scraper_type"),
         nullable=False,
         comment="ics, rss, html, json, csv",
     )
@@ -48,7 +66,7 @@ class ScraperLog(Base, TimestampMixin):
         nullable=True,
     )
     status: Mapped[str] = mapped_column(
-        String(20),
+        Enum(*SCRAPER_STATUSES, name="scraper_status"),
         nullable=False,
         comment="success, failed, partial",
     )
@@ -80,7 +98,15 @@ class ScraperLog(Base, TimestampMixin):
     )
 
     # Quality metrics
+    # Generated from the counters (NULL when nothing was found); read back via
+    # RETURNING on insert
     pass_rate: Mapped[Optional[float]] = mapped_column(
+        Float,
+        Computed(
+            "CASE WHEN activities_found > 0 "
+            "THEN activities_passed::float8 * 100 / activities_found END",
+            persisted=True,
+        ),
         nullable=True,
         comment="Percentage of activities that passed validation (0-100)",
     )
@@ -138,9 +164,45 @@ class ScraperLog(Base, TimestampMixin):
         - Pass rate < 85% for 2 consecutive runs
         - HTTP errors (4xx, 5xx)
         - Broken links > 5%
+
+        Only this run is checked here; providers_to_demote applies the
+        consecutive-run rule across runs.
         """
-        if self.pass_rate is not None and self.pass_rate < 85.0:
+        if self.pass_rate is not None and self.pass_rate < DEMOTION_PASS_RATE:
             return True
         if self.http_status and self.http_status >= 400:
             return True
         return False
+
+    @classmethod
+    async def providers_to_demote(cls, db: AsyncSession) -> list[int]:
+        """
+        Find providers whose latest runs all fell below the pass-rate threshold.
+
+        Ranks each provider's runs newest first in one query and keeps
+        providers with DEMOTION_CONSECUTIVE_RUNS failing runs on top. Runs
+        without a pass rate (nothing found) do not count as failing.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Provider IDs to demote
+        """
+        ranked = select(
+            cls.provider_id,
+            func.coalesce(cls.pass_rate < DEMOTION_PASS_RATE, false()).label("failed"),
+            func.row_number().over(
+                partition_by=cls.provider_id,
+                order_by=cls.run_started_at.desc(),
+            ).label("rn"),
+        ).subquery()
+
+        result = await db.execute(
+            select(ranked.c.provider_id)
+            .where(ranked.c.rn <= DEMOTION_CONSECUTIVE_RUNS)
+            .group_by(ranked.c.provider_id)
+            .having(func.count() == DEMOTION_CONSECUTIVE_RUNS)
+            .having(func.bool_and(ranked.c.failed))
+        )
+        return list(result.scalars().all())
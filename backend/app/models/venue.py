@@ -6,7 +6,8 @@ Venue model for activity locations.
 from typing import TYPE_CHECKING, Optional
 
 from geoalchemy2 import Geography
-from sqlalchemy import Integer, String, Text
+from sqlalchemy import Index, Integer, String, Text, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin
@@ -20,9 +21,18 @@ class Venue(Base, TimestampMixin):
     Venue/location where activities take place.
 
     Uses PostGIS for geospatial queries and geohash for proximity matching.
+
+    The table is clustered on ix_venues_geohash (migration 012) so nearby
+    venues share heap pages; keep that index, and run ``CLUSTER venues``
+    after bulk venue loads.
     """
 
     __tablename__ = "venues"
+    __table_args__ = (
+        # SP-GiST point index backing ST_DWithin radius lookups; declared here
+        # (with spatial_index=False below) so create_all matches migration 004
+        Index("idx_venues_location", "location", postgresql_using="spgist"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
 
@@ -35,13 +45,14 @@ class Venue(Base, TimestampMixin):
 
     # Geospatial (PostGIS Point)
     location: Mapped[Optional[str]] = mapped_column(
-        Geography(geometry_type="POINT", srid=4326),
+        Geography(geometry_type="POINT", srid=4326, spatial_index=False),
         nullable=True,
     )
 
-    # Geohash for proximity matching (precision 6 = ~1.2km)
+    # Geohash for proximity matching (precision 6 = ~1.2km). "C" collation
+    # orders byte-wise, so prefix ranges are plain B-tree range scans.
     geohash: Mapped[Optional[str]] = mapped_column(
-        String(12),
+        String(12, collation="C"),
         nullable=True,
         index=True,
         comment="Geohash for proximity matching",
@@ -65,3 +76,31 @@ class Venue(Base, TimestampMixin):
 
     def __repr__(self) -> str:
         return f"<Venue(id={self.id}, name={self.name}, city={self.city})>"
+
+    @classmethod
+    async def prefix_neighbors(cls, db: AsyncSession, prefix: str) -> list["Venue"]:
+        """
+        Find venues whose geohash starts with a prefix.
+
+        A shared geohash prefix bounds the distance between points, so this
+        is a cheap neighborhood lookup. Issued as a half-open range on the
+        "C"-collated column: one B-tree range scan on ix_venues_geohash.
+
+        Args:
+            db: Database session
+            prefix: Geohash prefix (e.g. the first 5 characters of a point's geohash)
+
+        Returns:
+            Venues in the prefix cell
+
+        Raises:
+            ValueError: If prefix is empty
+        """
+        if not prefix:
+            raise ValueError("Geohash prefix must not be empty")
+
+        upper_bound = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        result = await db.execute(
+            select(cls).where(cls.geohash >= prefix, cls.geohash < upper_bound)
+        )
+        return list(result.scalars().all())
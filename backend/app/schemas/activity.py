@@ -4,10 +4,12 @@ Pydantic schemas for activities.
 from datetime import date, datetime, time
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field, field_serializer
+from pydantic import Field
 
+from app.schemas.base import TrustedResponse
 
-class ActivityResponse(BaseModel):
+
+class ActivityResponse(TrustedResponse):
     """Schema for activity response."""
 
     id: int = Field(..., description="Activity ID")
@@ -36,15 +38,8 @@ class ActivityResponse(BaseModel):
     created_at: datetime = Field(..., description="Creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
 
-    @field_serializer('created_at', 'updated_at')
-    def serialize_datetime(self, dt: datetime) -> str:
-        """Serialize datetime to ISO format string."""
-        return dt.isoformat()
-
-    model_config = {"from_attributes": True}
 
-
-class ProviderResponse(BaseModel):
+class ProviderResponse(TrustedResponse):
     """Schema for provider response."""
 
     id: int = Field(..., description="Provider ID")
@@ -54,15 +49,8 @@ class ProviderResponse(BaseModel):
     website: Optional[str] = Field(None, description="Website")
     created_at: datetime = Field(..., description="Creation timestamp")
 
-    @field_serializer('created_at')
-    def serialize_datetime(self, dt: datetime) -> str:
-        """Serialize datetime to ISO format string."""
-        return dt.isoformat()
-
-    model_config = {"from_attributes": True}
 
-
-class VenueResponse(BaseModel):
+class VenueResponse(TrustedResponse):
     """Schema for venue response."""
 
     id: int = Field(..., description="Venue ID")
@@ -74,10 +62,3 @@ class VenueResponse(BaseModel):
     wheelchair_accessible: Optional[bool] = Field(None, description="Wheelchair accessible")
     parking_available: Optional[bool] = Field(None, description="Parking available")
     created_at: datetime = Field(..., description="Creation timestamp")
-
-    @field_serializer('created_at')
-    def serialize_datetime(self, dt: datetime) -> str:
-        """Serialize datetime to ISO format string."""
-        return dt.isoformat()
-
-    model_config = {"from_attributes": True}
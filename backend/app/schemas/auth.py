@@ -3,7 +3,9 @@ Pydantic schemas for authentication.
 """
 from datetime import datetime
 
-from pydantic import BaseModel, EmailStr, Field, field_serializer
+from pydantic import BaseModel, EmailStr, Field
+
+from app.schemas.base import TrustedResponse
 
 
 class UserRegister(BaseModel):
@@ -38,17 +40,10 @@ class TokenRefresh(BaseModel):
     refresh_token: str = Field(..., description="JWT refresh token")
 
 
-class UserResponse(BaseModel):
+class UserResponse(TrustedResponse):
     """Schema for user response."""
 
     id: int = Field(..., description="User ID")
     email: str = Field(..., description="User email")
     is_active: bool = Field(..., description="User active status")
     created_at: datetime = Field(..., description="User creation timestamp")
-
-    @field_serializer('created_at')
-    def serialize_datetime(self, dt: datetime) -> str:
-        """Serialize datetime to ISO format string."""
-        return dt.isoformat()
-
-    model_config = {"from_attributes": True}
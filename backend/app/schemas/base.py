@@ -0,0 +1,50 @@
+"""
+Base schemas shared across response models.
+"""
+from collections.abc import Iterable
+from typing import Any, ClassVar
+
+import orjson
+from pydantic import BaseModel
+
+
+class TrustedResponse(BaseModel):
+    """
+    Response schema that can be encoded from ORM rows without validation.
+
+    Rows loaded from our own database already satisfy the schema, so list
+    endpoints use encode_trusted instead of paying for model_validate on
+    every row. Input schemas must keep validating.
+    """
+
+    model_config = {"from_attributes": True}
+
+    # Field names in declaration order, built once per schema
+    _trusted_fields: ClassVar[tuple[str, ...]] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._trusted_fields = tuple(cls.model_fields)
+
+    @classmethod
+    def encode_trusted(cls, objs: Iterable[Any]) -> bytes:
+        """
+        Encode trusted ORM objects straight to a JSON array.
+
+        Reads each schema field off the object and hands the dicts to orjson,
+        so no model instances are built at all. Only valid for schemas whose
+        fields are JSON-native or types orjson encodes the same way as
+        Pydantic (date, time, datetime as ISO 8601 with "Z" for UTC).
+
+        Args:
+            objs: ORM instances exposing every schema field as an attribute
+
+        Returns:
+            JSON bytes
+        """
+        fields = cls._trusted_fields
+        return orjson.dumps(
+            [{field: getattr(obj, field) for field in fields} for obj in objs],
+            option=orjson.OPT_UTC_Z,
+        )
@@ -2,9 +2,16 @@
 Pydantic schemas for child profiles.
 """
 from datetime import date, datetime
-from typing import Any, Optional
+from typing import Any, Literal, Optional
 
-from pydantic import BaseModel, Field, field_serializer
+from pydantic import BaseModel, Field
+
+from app.schemas.base import TrustedResponse
+
+# Shared by both ScheduleWindow bounds. pydantic-core compiles it once per
+# field when the class is built. [0-9] rather than \d, which is Unicode-aware
+# in pydantic-core's regex engine and would accept non-ASCII digits.
+TIME_OF_DAY_PATTERN = r"^[0-9]{2}:[0-9]{2}$"
 
 
 class TemperamentSchema(BaseModel):
@@ -13,41 +20,49 @@ class TemperamentSchema(BaseModel):
     big_five: dict[str, int] = Field(
         ...,
         description="Big Five personality traits (1-5 scale)",
-        example={
-            "openness": 3,
-            "conscientiousness": 4,
-            "extraversion": 2,
-            "agreeableness": 5,
-            "neuroticism": 2,
-        },
     )
-    sensory_sensitivity: str = Field(
+    sensory_sensitivity: Literal["low", "medium", "high"] = Field(
         ...,
         description="Sensory sensitivity level",
-        pattern="^(low|medium|high)$",
     )
-    intensity_preference: str = Field(
+    intensity_preference: Literal["low", "moderate", "high"] = Field(
         ...,
         description="Intensity preference level",
-        pattern="^(low|moderate|high)$",
     )
-    social_preference: str = Field(
+    social_preference: Literal["solo", "small_group", "team"] = Field(
         ...,
         description="Social activity preference",
-        pattern="^(solo|small_group|team)$",
     )
 
+    # One model-level example instead of the deprecated per-field example=
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "big_five": {
+                        "openness": 3,
+                        "conscientiousness": 4,
+                        "extraversion": 2,
+                        "agreeableness": 5,
+                        "neuroticism": 2,
+                    },
+                    "sensory_sensitivity": "medium",
+                    "intensity_preference": "moderate",
+                    "social_preference": "small_group",
+                }
+            ]
+        }
+    }
+
 
 class ScheduleWindow(BaseModel):
     """Schema for schedule availability window."""
 
-    day: str = Field(
-        ...,
-        description="Day of week",
-        pattern="^(monday|tuesday|wednesday|thursday|friday|saturday|sunday)$",
-    )
-    start: str = Field(..., description="Start time (HH:MM format)", pattern=r"^\d{2}:\d{2}$")
-    end: str = Field(..., description="End time (HH:MM format)", pattern=r"^\d{2}:\d{2}$")
+    day: Literal[
+        "monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"
+    ] = Field(..., description="Day of week")
+    start: str = Field(..., description="Start time (HH:MM format)", pattern=TIME_OF_DAY_PATTERN)
+    end: str = Field(..., description="End time (HH:MM format)", pattern=TIME_OF_DAY_PATTERN)
 
 
 class ConstraintsSchema(BaseModel):
@@ -120,7 +135,7 @@ class ChildProfileUpdate(BaseModel):
     notes: Optional[str] = None
 
 
-class ChildProfileResponse(BaseModel):
+class ChildProfileResponse(TrustedResponse):
     """Schema for child profile response."""
 
     id: int = Field(..., description="Child profile ID")
@@ -138,10 +153,3 @@ class ChildProfileResponse(BaseModel):
     notes: Optional[str] = Field(None, description="Notes")
     created_at: datetime = Field(..., description="Creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
-
-    @field_serializer('created_at', 'updated_at')
-    def serialize_datetime(self, dt: datetime) -> str:
-        """Serialize datetime to ISO format string."""
-        return dt.isoformat()
-
-    model_config = {"from_attributes": True}
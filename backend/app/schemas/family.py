@@ -4,7 +4,7 @@ Pydantic schemas for family profiles.
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, EmailStr, Field, field_serializer
+from pydantic import BaseModel, EmailStr, Field
 
 
 class FamilyCreate(BaseModel):
@@ -62,9 +62,4 @@ class FamilyResponse(BaseModel):
     created_at: datetime = Field(..., description="Creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
 
-    @field_serializer('created_at', 'updated_at')
-    def serialize_datetime(self, dt: datetime) -> str:
-        """Serialize datetime to ISO format string."""
-        return dt.isoformat()
-
     model_config = {"from_attributes": True}
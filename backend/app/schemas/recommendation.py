@@ -1,9 +1,10 @@
 """
 Pydantic schemas for recommendations.
 """
+from datetime import datetime
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class RecommendationRequest(BaseModel):
@@ -30,12 +31,21 @@ class RecommendationResponse(BaseModel):
     fit_score: float = Field(..., description="Fit score component")
     practical_score: float = Field(..., description="Practical score component")
     goals_score: float = Field(..., description="Goals score component")
-    score_details: dict[str, Any] = Field(..., description="Detailed score breakdown")
+    # Written only by the scoring engine, so passed through as-is instead of
+    # validated key by key
+    score_details: Any = Field(
+        ...,
+        description="Detailed score breakdown: points per component under fit, practical and goals",
+    )
     tier: str = Field(..., description="Recommendation tier (primary, budget_saver, stretch)")
     explanation: Optional[str] = Field(None, description="Human-readable explanation")
     why_good_fit: Optional[list[str]] = Field(None, description="Why it's a good fit")
     considerations: Optional[list[str]] = Field(None, description="Things to consider")
     future_benefits: Optional[list[str]] = Field(None, description="Long-term benefits")
-    generated_at: str = Field(..., description="Generation timestamp")
+    generated_at: datetime = Field(..., description="Generation timestamp")
 
     model_config = {"from_attributes": True}
+
+
+# Built once: validates/serializes a whole list in one pydantic-core call
+RecommendationResponseList = TypeAdapter(list[RecommendationResponse])
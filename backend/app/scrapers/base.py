@@ -1,15 +1,22 @@
 """
 Base scraper class for all data source scrapers.
 """
+import asyncio
 import hashlib
 import logging
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from datetime import datetime, timezone
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, ClassVar, Optional
+from urllib.parse import urlsplit
 
+import httpx
 import pygeohash
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.bulk import copy_activities
 from app.models.activity import Activity
 from app.models.provider import Provider
 from app.models.scraper_log import ScraperLog
@@ -17,6 +24,18 @@ from app.models.venue import Venue
 
 logger = logging.getLogger(__name__)
 
+# Rows per IN-list / executemany batch in save_activities_bulk
+BULK_CHUNK_SIZE = 1000
+
+# Above this many new rows, save_activities_bulk loads them with COPY
+COPY_THRESHOLD = 500
+
+
+@lru_cache(maxsize=1024)
+def _normalize_org_name(org_name: str) -> bytes:
+    """Lowercase and collapse spaces, UTF-8 encoded; memoized as one scrape run shares an org."""
+    return " ".join(org_name.lower().split()).encode()
+
 
 class BaseScraper(ABC):
     """
@@ -27,8 +46,15 @@ class BaseScraper(ABC):
     - Quality validation
     - Logging and metrics
     - Error handling
+    - A shared HTTP client (connection pooling across runs)
     """
 
+    # One client per event loop, shared by every scraper so keep-alive
+    # connections and TLS sessions are reused across fetches and providers.
+    # HTTP/2 is not enabled: it needs the optional h2 package.
+    _client: ClassVar[Optional[httpx.AsyncClient]] = None
+    _client_loop: ClassVar[Optional[asyncio.AbstractEventLoop]] = None
+
     def __init__(
         self,
         db: AsyncSession,
@@ -59,6 +85,36 @@ class BaseScraper(ABC):
         # Start time for logging
         self.run_started_at = datetime.now(timezone.utc)
 
+    @classmethod
+    async def get_client(cls) -> httpx.AsyncClient:
+        """
+        Get the shared HTTP client, creating it on first use.
+
+        Celery tasks run each job in a fresh event loop (asyncio.run), and a
+        client's connections cannot outlive their loop, so a client left over
+        from another loop is replaced.
+
+        Returns:
+            Shared AsyncClient
+        """
+        loop = asyncio.get_running_loop()
+        if BaseScraper._client is None or BaseScraper._client_loop is not loop:
+            BaseScraper._client = httpx.AsyncClient(
+                timeout=30.0,
+                limits=httpx.Limits(max_connections=256, max_keepalive_connections=64),
+            )
+            BaseScraper._client_loop = loop
+        return BaseScraper._client
+
+    @classmethod
+    async def close_client(cls) -> None:
+        """Close the shared HTTP client; call before the event loop ends."""
+        client = BaseScraper._client
+        BaseScraper._client = None
+        BaseScraper._client_loop = None
+        if client is not None:
+            await client.aclose()
+
     @abstractmethod
     async def fetch_data(self) -> Any:
         """
@@ -113,23 +169,44 @@ class BaseScraper(ABC):
         Returns:
             SHA256 hash for de-duplication
         """
-        # Normalize name: lowercase, strip, collapse spaces
-        normalized_name = " ".join(name.lower().strip().split())
-
-        # Normalize org name
-        normalized_org = " ".join(org_name.lower().strip().split())
-
-        # Use geohash6 for proximity matching
-        geohash6 = geohash[:6] if geohash else "UNKNOWN"
+        # Components are encoded separately and joined as bytes, so the
+        # "|"-separated key is never built as an intermediate str.
+        # str.split() already drops leading/trailing whitespace.
+        canon_bytes = b"|".join((
+            " ".join(name.lower().split()).encode(),
+            (start_date or "NODATE").encode(),
+            (geohash[:6] if geohash else "UNKNOWN").encode(),
+            _normalize_org_name(org_name),
+        ))
+
+        # Generate SHA256 hash (OpenSSL-backed; changing the algorithm would
+        # orphan every stored canon_hash and break de-duplication)
+        return hashlib.sha256(canon_bytes).hexdigest()
+
+    def generate_canon_hashes_batch(self, activities: list[dict[str, Any]]) -> list[str]:
+        """
+        Generate canon_hashes for a batch of this provider's activities.
 
-        # Date (exact for now, fuzzy matching can be added later)
-        date_str = start_date or "NODATE"
+        Delegates to generate_canon_hash per row, so there is one hash
+        formula; the provider name's normalization is memoized.
 
-        # Combine components
-        canon_str = f"{normalized_name}|{date_str}|{geohash6}|{normalized_org}"
+        Args:
+            activities: Activity dictionaries
 
-        # Generate SHA256 hash
-        return hashlib.sha256(canon_str.encode()).hexdigest()
+        Returns:
+            SHA256 hashes in input order
+        """
+        generate = self.generate_canon_hash
+        org_name = self.provider.name
+        return [
+            generate(
+                name=activity_data.get("name", ""),
+                start_date=str(activity_data.get("start_date", "")),
+                geohash=activity_data.get("geohash", ""),
+                org_name=org_name,
+            )
+            for activity_data in activities
+        ]
 
     def validate_activity(self, activity_data: dict[str, Any]) -> tuple[bool, list[str]]:
         """
@@ -176,15 +253,15 @@ class BaseScraper(ABC):
 
         return len(errors) == 0, errors
 
-    async def save_activity(self, activity_data: dict[str, Any]) -> Activity | None:
+    def _check_activity(self, activity_data: dict[str, Any]) -> bool:
         """
-        Save activity to database with de-duplication.
+        Validate an activity and record found/failed metrics.
 
         Args:
             activity_data: Activity dictionary
 
         Returns:
-            Created/updated Activity or None if duplicate
+            True if the activity passed validation
         """
         self.activities_found += 1
 
@@ -200,21 +277,28 @@ class BaseScraper(ABC):
                 self.validation_failures[error_type] = (
                     self.validation_failures.get(error_type, 0) + 1
                 )
+
+        return is_valid
+
+    async def save_activity(self, activity_data: dict[str, Any]) -> Activity | None:
+        """
+        Save activity to database with de-duplication.
+
+        Args:
+            activity_data: Activity dictionary
+
+        Returns:
+            Created/updated Activity or None if duplicate
+        """
+        if not self._check_activity(activity_data):
             return None
 
         # Generate canon_hash for de-duplication
-        canon_hash = self.generate_canon_hash(
-            name=activity_data.get("name", ""),
-            start_date=str(activity_data.get("start_date", "")),
-            geohash=activity_data.get("geohash", ""),
-            org_name=self.provider.name,
-        )
+        canon_hash = self.generate_canon_hashes_batch([activity_data])[0]
 
         # Check for duplicate
-        from sqlalchemy import select
-
         result = await self.db.execute(
-            select(Activity).where(Activity.canon_hash == canon_hash)
+            select(Activity.id).where(Activity.canon_hash == canon_hash)
         )
         existing = result.scalar_one_or_none()
 
@@ -235,6 +319,61 @@ class BaseScraper(ABC):
 
         return activity
 
+    async def save_activities_bulk(self, activities: list[dict[str, Any]]) -> int:
+        """
+        Save a batch of activities with de-duplication in a constant number of queries.
+
+        Validates and hashes every row in Python, drops duplicates within the
+        batch, finds already-stored canon_hashes with one IN query per chunk,
+        and inserts the rest with executemany INSERTs, or with one binary COPY
+        when there are more than COPY_THRESHOLD of them (e.g. a provider's
+        first ingest). Metrics match calling save_activity per row.
+
+        Args:
+            activities: Activity dictionaries from parse_data()
+
+        Returns:
+            Number of activities inserted
+        """
+        valid = [a for a in activities if self._check_activity(a)]
+
+        pending: dict[str, dict[str, Any]] = {}
+        for canon_hash, activity_data in zip(self.generate_canon_hashes_batch(valid), valid):
+            if canon_hash in pending:
+                self.duplicates_found += 1
+                continue
+            pending[canon_hash] = activity_data
+
+        if not pending:
+            return 0
+
+        hashes = list(pending)
+        existing: set[str] = set()
+        for i in range(0, len(hashes), BULK_CHUNK_SIZE):
+            result = await self.db.execute(
+                select(Activity.canon_hash).where(
+                    Activity.canon_hash.in_(hashes[i:i + BULK_CHUNK_SIZE])
+                )
+            )
+            existing.update(result.scalars())
+
+        self.duplicates_found += len(existing)
+        rows = [
+            {**activity_data, "provider_id": self.provider.id, "canon_hash": canon_hash}
+            for canon_hash, activity_data in pending.items()
+            if canon_hash not in existing
+        ]
+
+        if len(rows) > COPY_THRESHOLD:
+            # Rows are known-new, so a plain COPY needs no conflict handling
+            await copy_activities(self.db, rows)
+        else:
+            for i in range(0, len(rows), BULK_CHUNK_SIZE):
+                await self.db.execute(insert(Activity), rows[i:i + BULK_CHUNK_SIZE])
+
+        self.activities_passed += len(rows)
+        return len(rows)
+
     async def create_scraper_log(self, status: str, http_status: Optional[int] = None) -> ScraperLog:
         """
         Create scraper log entry with metrics.
@@ -248,12 +387,6 @@ class BaseScraper(ABC):
         """
         run_completed_at = datetime.now(timezone.utc)
 
-        # Calculate pass rate
-        total = self.activities_found
-        pass_rate = (
-            (self.activities_passed / total * 100.0) if total > 0 else None
-        )
-
         log = ScraperLog(
             provider_id=self.provider.id,
             scraper_type=self.scraper_type,
@@ -264,7 +397,6 @@ class BaseScraper(ABC):
             activities_passed=self.activities_passed,
             activities_failed=self.activities_failed,
             duplicates_found=self.duplicates_found,
-            pass_rate=pass_rate,
             http_status=http_status,
             errors=self.errors if self.errors else None,
             warnings=self.warnings if self.warnings else None,
@@ -274,20 +406,23 @@ class BaseScraper(ABC):
         self.db.add(log)
         await self.db.commit()
 
+        # pass_rate is generated by the database; None when nothing was found
+        pass_rate = "n/a" if log.pass_rate is None else f"{log.pass_rate:.1f}%"
+
         # Log summary
         logger.info(
             f"Scraper run completed: provider={self.provider.name}, "
             f"type={self.scraper_type}, status={status}, "
             f"found={self.activities_found}, passed={self.activities_passed}, "
             f"failed={self.activities_failed}, duplicates={self.duplicates_found}, "
-            f"pass_rate={pass_rate:.1f}%"
+            f"pass_rate={pass_rate}"
         )
 
         # Check if should demote
         if log.should_demote:
             logger.warning(
                 f"Provider {self.provider.name} should be demoted "
-                f"(pass_rate={pass_rate:.1f}%, http_status={http_status})"
+                f"(pass_rate={pass_rate}, http_status={http_status})"
             )
 
         return log
@@ -316,14 +451,11 @@ class BaseScraper(ABC):
 
             logger.info(f"Parsed {len(activities)} activities from {self.provider.name}")
 
-            # Save each activity
-            for activity_data in activities:
-                await self.save_activity(activity_data)
-
-            # Commit all activities
-            await self.db.commit()
+            # Save all activities (batched duplicate check and inserts)
+            await self.save_activities_bulk(activities)
 
-            # Create log
+            # Create log; its commit also commits the activities, so a run
+            # costs one transaction
             status = "success" if self.activities_failed == 0 else "partial"
             return await self.create_scraper_log(status=status, http_status=200)
 
@@ -336,3 +468,44 @@ class BaseScraper(ABC):
             self.errors.append(str(e))
             await self.db.rollback()
             return await self.create_scraper_log(status="failed")
+
+    @classmethod
+    async def run_many(
+        cls,
+        scrapers: list["BaseScraper"],
+        host_limit: int = 8,
+        total_limit: int = 64,
+    ) -> list[ScraperLog | BaseException]:
+        """
+        Run scrapers concurrently with bounded concurrency.
+
+        Scraping is bound by network latency, so runs overlap instead of going
+        one provider at a time. At most total_limit run at once overall and
+        host_limit per data source host, so one site serving many providers
+        is not hammered. Each scraper must have its own database session.
+
+        Args:
+            scrapers: Scrapers to run
+            host_limit: Maximum concurrent runs against one host
+            total_limit: Maximum concurrent runs overall
+
+        Returns:
+            ScraperLog per scraper in input order, or the exception a run
+            raised (run() itself logs failures, so this is rare)
+        """
+        total_sem = asyncio.BoundedSemaphore(total_limit)
+        host_sems: defaultdict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(host_limit)
+        )
+
+        async def run_one(scraper: "BaseScraper") -> ScraperLog:
+            host = urlsplit(scraper.provider.data_source_url or "").hostname or ""
+            # Host slot first, so runs queued behind a busy host do not hold
+            # global slots that runs against other hosts could use
+            async with host_sems[host], total_sem:
+                return await scraper.run()
+
+        return await asyncio.gather(
+            *(run_one(scraper) for scraper in scrapers),
+            return_exceptions=True,
+        )
@@ -6,10 +6,14 @@ Supports:
 - CSV exports from recreation systems
 - Structured CSV files
 """
+import codecs
 import csv
 import io
 import logging
-from datetime import datetime
+import re
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator
+from datetime import date, datetime, time
 from typing import Any, Optional
 
 import httpx
@@ -17,9 +21,224 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.provider import Provider
 from app.scrapers.base import BaseScraper
+from app.scrapers.ratelimit import send_with_retry
 
 logger = logging.getLogger(__name__)
 
+# Compiled once; _parse_row runs per CSV row
+_PRICE_RE = re.compile(r'[\d.]+')
+_AGE_RANGE_RE = re.compile(r'(\d+)[\s-]+(?:to|-)?[\s-]*(\d+)')
+_AGE_SINGLE_RE = re.compile(r'(\d+)')
+
+# Start date shapes, matched with fullmatch so each value costs at most one
+# parse instead of a strptime attempt (and ValueError) per candidate format
+_ISO_DATE_RE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})')
+_SLASH_DATE_RE = re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})')
+_DATETIME_SHAPES = (
+    (re.compile(r'\d{4}-\d{1,2}-\d{1,2} \d{1,2}:\d{1,2}:\d{1,2}'), "%Y-%m-%d %H:%M:%S"),
+    (re.compile(r'\d{1,2}/\d{1,2}/\d{4} \d{1,2}:\d{1,2}'), "%m/%d/%Y %H:%M"),
+)
+
+# Accepted column names per field, in priority order (lowercased)
+_NAME_COLS = ("name", "title", "activity", "program", "event_name")
+_DESCRIPTION_COLS = ("description", "details", "summary")
+_START_COLS = ("start_date", "date", "start", "event_date", "begin_date")
+_VENUE_COLS = ("venue", "location", "facility", "place")
+_ADDRESS_COLS = ("address", "street_address")
+_ZIP_COLS = ("zip", "zip_code", "postal_code")
+_PRICE_COLS = ("price", "cost", "fee", "registration_fee")
+_AGE_COLS = ("age", "ages", "age_range", "age_group")
+_MIN_AGE_COLS = ("min_age", "age_min")
+_MAX_AGE_COLS = ("max_age", "age_max")
+_URL_COLS = ("url", "link", "registration_url", "website")
+
+_FIELD_COLUMNS: dict[str, tuple[str, ...]] = {
+    "name": _NAME_COLS,
+    "description": _DESCRIPTION_COLS,
+    "start": _START_COLS,
+    "venue": _VENUE_COLS,
+    "address": _ADDRESS_COLS,
+    "city": ("city",),
+    "state": ("state",),
+    "zip": _ZIP_COLS,
+    "price": _PRICE_COLS,
+    "age": _AGE_COLS,
+    "min_age": _MIN_AGE_COLS,
+    "max_age": _MAX_AGE_COLS,
+    "url": _URL_COLS,
+}
+
+
+def _column_layout(header: list[str]) -> dict[str, tuple[int, ...]]:
+    """
+    Resolve each field's accepted column names to positions in the header.
+
+    Header names are matched case-insensitively after stripping; when a name
+    repeats, the last column wins (as it did with DictReader).
+
+    Args:
+        header: First CSV row
+
+    Returns:
+        Dict mapping field to column indices in priority order
+    """
+    index = {name.strip().lower(): i for i, name in enumerate(header)}
+    return {
+        field: tuple(index[column] for column in columns if column in index)
+        for field, columns in _FIELD_COLUMNS.items()
+    }
+
+
+def _first(row: list[str], indices: tuple[int, ...]) -> Optional[str]:
+    """Return the first non-empty stripped value at indices, or None."""
+    for i in indices:
+        if i < len(row):
+            value = row[i].strip()
+            if value:
+                return value
+    return None
+
+
+def _parse_start(value: str) -> tuple[Optional[date], Optional[time]]:
+    """
+    Parse a CSV start date, with a time if the value carries one.
+
+    Accepts YYYY-MM-DD, MM/DD/YYYY (DD/MM/YYYY when the first part cannot be
+    a month), YYYY-MM-DD HH:MM:SS and MM/DD/YYYY HH:MM.
+
+    Args:
+        value: Stripped cell value
+
+    Returns:
+        Tuple of (date, time); both None for unrecognized shapes
+
+    Raises:
+        ValueError: If the value has a known shape but is not a real date
+    """
+    match = _ISO_DATE_RE.fullmatch(value)
+    if match:
+        year, month, day = map(int, match.groups())
+        return date(year, month, day), None
+
+    match = _SLASH_DATE_RE.fullmatch(value)
+    if match:
+        first, second, year = map(int, match.groups())
+        try:
+            return date(year, first, second), None
+        except ValueError:
+            return date(year, second, first), None
+
+    for pattern, fmt in _DATETIME_SHAPES:
+        if pattern.fullmatch(value):
+            dt = datetime.strptime(value, fmt)
+            return dt.date(), dt.time()
+
+    return None, None
+
+
+class _RecordSplitter:
+    """
+    Splits streamed CSV text into lines, holding back an unfinished record.
+
+    A newline inside a quoted field does not end a record. Quote state
+    follows csv's rules: a quote opens a quoted field only at the start of a
+    field, "" inside one is an escaped quote, and any other quote is literal
+    text. A stray quote in an unquoted field (12" pie) therefore does not
+    hold back the rest of the feed. Each line is scanned once, and lines
+    without quotes skip the scan entirely.
+    """
+
+    def __init__(self, delimiter: str):
+        self.delimiter = delimiter
+        self._partial = ""  # text after the last newline seen
+        self._record: list[str] = []  # lines of the current unfinished record
+        self._in_quotes = False
+
+    def push(self, text: str) -> list[str]:
+        """
+        Add streamed text.
+
+        Args:
+            text: Next chunk of decoded CSV text
+
+        Returns:
+            Lines (with line endings) of records completed by this chunk
+        """
+        lines = io.StringIO(self._partial + text, newline="").readlines()
+        self._partial = lines.pop() if lines and not lines[-1].endswith("\n") else ""
+
+        complete: list[str] = []
+        for line in lines:
+            self._record.append(line)
+            if self._ends_record(line):
+                complete.extend(self._record)
+                self._record = []
+        return complete
+
+    def flush(self) -> list[str]:
+        """Return everything still held back, at the end of the stream."""
+        rest = self._record
+        if self._partial:
+            rest.append(self._partial)
+        self._record = []
+        self._partial = ""
+        return rest
+
+    def _ends_record(self, line: str) -> bool:
+        """Advance the quote state over one line; True if the record ends with it."""
+        if not self._in_quotes and '"' not in line:
+            return True
+
+        delimiter = self.delimiter
+        in_quotes = self._in_quotes
+        pos = 0
+        while True:
+            if in_quotes:
+                i = line.find('"', pos)
+                if i < 0:
+                    break
+                if line.startswith('"', i + 1):
+                    pos = i + 2
+                    continue
+                in_quotes = False
+                pos = i + 1
+            elif line.startswith('"', pos):
+                in_quotes = True
+                pos += 1
+                continue
+            # The rest of this field is literal: jump to the next field start
+            i = line.find(delimiter, pos)
+            if i < 0:
+                break
+            pos = i + 1
+
+        self._in_quotes = in_quotes
+        return not in_quotes
+
+
+class _LineFeed:
+    """
+    Line iterator for csv.reader that can be refilled as text streams in.
+
+    csv.reader asks its iterator for the next line on every call, so once it
+    stops on an empty feed it resumes when more lines are added.
+    """
+
+    def __init__(self):
+        self.lines: deque[str] = deque()
+
+    def feed(self, lines: list[str]) -> None:
+        """Queue lines that end complete records, with their line endings."""
+        self.lines.extend(lines)
+
+    def __iter__(self) -> "_LineFeed":
+        return self
+
+    def __next__(self) -> str:
+        if self.lines:
+            return self.lines.popleft()
+        raise StopIteration
+
 
 class CSVScraper(BaseScraper):
     """
@@ -51,67 +270,117 @@ class CSVScraper(BaseScraper):
         self.encoding = encoding
         self.delimiter = delimiter
 
-    async def fetch_data(self) -> str:
+    async def fetch_data(self) -> AsyncIterator[str]:
         """
-        Fetch CSV data from provider's data source URL.
+        Stream CSV data from provider's data source URL.
+
+        The body is decoded incrementally as it arrives instead of being
+        buffered and decoded in one piece, so parse_data can work through
+        large open data exports without holding them in memory twice.
 
         Returns:
-            Raw CSV data as string
+            Async iterator of decoded text chunks; the request is made when
+            iteration starts
 
         Raises:
-            httpx.HTTPError: If fetch fails
+            ValueError: If the provider has no data_source_url
         """
         if not self.provider.data_source_url:
             raise ValueError(f"Provider {self.provider.name} has no data_source_url")
 
-        logger.info(f"Fetching CSV from {self.provider.data_source_url}")
+        return self._stream_text(self.provider.data_source_url)
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(self.provider.data_source_url)
-            response.raise_for_status()
-            # Try to decode with specified encoding
-            try:
-                return response.text
-            except UnicodeDecodeError:
-                # Fallback to latin-1 if utf-8 fails
-                return response.content.decode("latin-1")
+    async def _stream_text(self, url: str) -> AsyncIterator[str]:
+        """
+        Fetch url and yield its body decoded with the configured encoding.
+
+        Raises:
+            httpx.HTTPError: If fetch fails
+        """
+        logger.info(f"Fetching CSV from {url}")
 
-    async def parse_data(self, raw_data: str) -> list[dict[str, Any]]:
+        # Undecodable bytes are replaced rather than failing the whole file
+        decoder = codecs.getincrementaldecoder(self.encoding)(errors="replace")
+
+        client = await self.get_client()
+        response = await send_with_retry(client, client.build_request("GET", url), stream=True)
+        try:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes():
+                text = decoder.decode(chunk)
+                if text:
+                    yield text
+        finally:
+            await response.aclose()
+
+        text = decoder.decode(b"", final=True)
+        if text:
+            yield text
+
+    async def parse_data(self, raw_data: AsyncIterable[str]) -> list[dict[str, Any]]:
         """
-        Parse CSV data into activity records.
+        Parse streamed CSV data into activity records.
+
+        Complete records are parsed as chunks arrive; only the trailing
+        partial record is buffered.
 
         Args:
-            raw_data: Raw CSV data as string
+            raw_data: Decoded CSV text chunks from fetch_data()
 
         Returns:
             List of activity dictionaries
+
+        Raises:
+            httpx.HTTPError: If the underlying fetch fails mid-stream
         """
-        activities = []
+        activities: list[dict[str, Any]] = []
+        layout: Optional[dict[str, tuple[int, ...]]] = None
 
-        try:
-            # Parse CSV
-            csv_reader = csv.DictReader(
-                io.StringIO(raw_data),
-                delimiter=self.delimiter
-            )
+        feed = _LineFeed()
+        csv_reader = csv.reader(feed, delimiter=self.delimiter)
 
-            # Extract rows
+        def drain() -> None:
+            nonlocal layout
             for row in csv_reader:
+                # Column names are resolved once from the header
+                if layout is None:
+                    layout = _column_layout(row)
+                    continue
+                if not row:
+                    continue
                 try:
-                    activity = self._parse_row(row)
+                    activity = self._parse_row(row, layout)
                     if activity:
                         activities.append(activity)
                 except Exception as e:
                     logger.warning(f"Failed to parse row: {str(e)}")
                     self.warnings.append(f"Row parse error: {str(e)}")
 
+        try:
+            splitter = _RecordSplitter(self.delimiter)
+            async for text in raw_data:
+                lines = splitter.push(text)
+                if lines:
+                    feed.feed(lines)
+                    drain()
+
+            feed.feed(splitter.flush())
+            drain()
+
+        except httpx.HTTPError:
+            # Fetch failures fail the run, as they did before streaming
+            raise
         except Exception as e:
             logger.error(f"Failed to parse CSV: {str(e)}")
             self.errors.append(f"CSV parse error: {str(e)}")
 
         return activities
 
-    def _parse_row(self, row_data: dict[str, str]) -> Optional[dict[str, Any]]:
+    def _parse_row(
+        self,
+        row: list[str],
+        layout: dict[str, tuple[int, ...]],
+    ) -> Optional[dict[str, Any]]:
         """
         Parse CSV row into activity dictionary.
 
@@ -121,75 +390,41 @@ class CSVScraper(BaseScraper):
         - Generic event CSVs
 
         Args:
-            row_data: Dictionary mapping column names to values
+            row: CSV row values
+            layout: Field to column indices, from _column_layout()
 
         Returns:
             Activity dictionary or None if invalid
         """
-        # Normalize column names (case-insensitive, strip whitespace)
-        normalized_row = {k.strip().lower(): v.strip() if v else "" for k, v in row_data.items()}
-
         # Extract name (common column names)
-        name = (
-            normalized_row.get("name") or
-            normalized_row.get("title") or
-            normalized_row.get("activity") or
-            normalized_row.get("program") or
-            normalized_row.get("event_name") or
-            ""
-        )
+        name = _first(row, layout["name"]) or ""
 
         if not name:
             return None
 
         # Extract description
-        description = (
-            normalized_row.get("description") or
-            normalized_row.get("details") or
-            normalized_row.get("summary") or
-            None
-        )
+        description = _first(row, layout["description"])
 
         # Extract dates (handle various formats)
         start_date = None
         start_time = None
 
-        start_str = (
-            normalized_row.get("start_date") or
-            normalized_row.get("date") or
-            normalized_row.get("start") or
-            normalized_row.get("event_date") or
-            normalized_row.get("begin_date")
-        )
+        start_str = _first(row, layout["start"])
 
         if start_str:
             try:
-                # Try common date formats
-                for fmt in ["%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", "%Y-%m-%d %H:%M:%S", "%m/%d/%Y %H:%M"]:
-                    try:
-                        dt = datetime.strptime(start_str, fmt)
-                        start_date = dt.date()
-                        if "%H" in fmt:
-                            start_time = dt.time()
-                        break
-                    except ValueError:
-                        continue
-            except Exception as e:
+                start_date, start_time = _parse_start(start_str)
+            except ValueError as e:
                 logger.warning(f"Failed to parse date: {start_str}, error: {str(e)}")
 
         # Extract location/venue
         venue = None
-        venue_name = (
-            normalized_row.get("venue") or
-            normalized_row.get("location") or
-            normalized_row.get("facility") or
-            normalized_row.get("place")
-        )
-
-        address = normalized_row.get("address") or normalized_row.get("street_address")
-        city = normalized_row.get("city")
-        state = normalized_row.get("state")
-        zip_code = normalized_row.get("zip") or normalized_row.get("zip_code") or normalized_row.get("postal_code")
+        venue_name = _first(row, layout["venue"])
+
+        address = _first(row, layout["address"])
+        city = _first(row, layout["city"])
+        state = _first(row, layout["state"])
+        zip_code = _first(row, layout["zip"])
 
         if venue_name or address:
             venue = {
@@ -202,17 +437,11 @@ class CSVScraper(BaseScraper):
 
         # Extract price
         price_cents = None
-        price_text = (
-            normalized_row.get("price") or
-            normalized_row.get("cost") or
-            normalized_row.get("fee") or
-            normalized_row.get("registration_fee")
-        )
+        price_text = _first(row, layout["price"])
 
         if price_text:
             # Try to extract number
-            import re
-            match = re.search(r'[\d.]+', price_text)
+            match = _PRICE_RE.search(price_text)
             if match:
                 try:
                     price_cents = int(float(match.group()) * 100)
@@ -222,17 +451,11 @@ class CSVScraper(BaseScraper):
         # Extract age range
         min_age = None
         max_age = None
-        age_range_text = (
-            normalized_row.get("age") or
-            normalized_row.get("ages") or
-            normalized_row.get("age_range") or
-            normalized_row.get("age_group")
-        )
+        age_range_text = _first(row, layout["age"])
 
         if age_range_text:
             # Try to parse "5-12" or "5 to 12" format
-            import re
-            match = re.search(r'(\d+)[\s-]+(?:to|-)?[\s-]*(\d+)', age_range_text)
+            match = _AGE_RANGE_RE.search(age_range_text)
             if match:
                 try:
                     min_age = int(match.group(1))
@@ -241,7 +464,7 @@ class CSVScraper(BaseScraper):
                     pass
             else:
                 # Try single age
-                match = re.search(r'(\d+)', age_range_text)
+                match = _AGE_SINGLE_RE.search(age_range_text)
                 if match:
                     try:
                         min_age = int(match.group(1))
@@ -250,7 +473,7 @@ class CSVScraper(BaseScraper):
 
         # Also check explicit min/max columns
         if not min_age:
-            min_age_str = normalized_row.get("min_age") or normalized_row.get("age_min")
+            min_age_str = _first(row, layout["min_age"])
             if min_age_str:
                 try:
                     min_age = int(min_age_str)
@@ -258,7 +481,7 @@ class CSVScraper(BaseScraper):
                     pass
 
         if not max_age:
-            max_age_str = normalized_row.get("max_age") or normalized_row.get("age_max")
+            max_age_str = _first(row, layout["max_age"])
             if max_age_str:
                 try:
                     max_age = int(max_age_str)
@@ -266,13 +489,7 @@ class CSVScraper(BaseScraper):
                     pass
 
         # Extract URL
-        url = (
-            normalized_row.get("url") or
-            normalized_row.get("link") or
-            normalized_row.get("registration_url") or
-            normalized_row.get("website") or
-            self.provider.data_source_url
-        )
+        url = _first(row, layout["url"]) or self.provider.data_source_url
 
         # Build activity dictionary
         activity = {
@@ -5,12 +5,12 @@ import logging
 from datetime import datetime
 from typing import Any
 
-import httpx
 from bs4 import BeautifulSoup
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.provider import Provider
 from app.scrapers.base import BaseScraper
+from app.scrapers.ratelimit import send_with_retry
 
 logger = logging.getLogger(__name__)
 
@@ -58,10 +58,12 @@ class HTMLScraper(BaseScraper):
 
         logger.info(f"Fetching HTML from {self.provider.data_source_url}")
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(self.provider.data_source_url)
-            response.raise_for_status()
-            return response.text
+        client = await self.get_client()
+        response = await send_with_retry(
+            client, client.build_request("GET", self.provider.data_source_url)
+        )
+        response.raise_for_status()
+        return response.text
 
     async def parse_data(self, raw_data: str) -> list[dict[str, Any]]:
         """
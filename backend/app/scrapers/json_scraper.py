@@ -11,11 +11,11 @@ import logging
 from datetime import datetime
 from typing import Any, Optional
 
-import httpx
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.provider import Provider
 from app.scrapers.base import BaseScraper
+from app.scrapers.ratelimit import send_with_retry
 
 logger = logging.getLogger(__name__)
 
@@ -72,10 +72,13 @@ class JSONScraper(BaseScraper):
             # Some APIs use different auth headers
             headers["X-API-Key"] = self.api_key
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(self.provider.data_source_url, headers=headers)
-            response.raise_for_status()
-            return response.json()
+        client = await self.get_client()
+        response = await send_with_retry(
+            client,
+            client.build_request("GET", self.provider.data_source_url, headers=headers),
+        )
+        response.raise_for_status()
+        return response.json()
 
     async def parse_data(self, raw_data: dict[str, Any]) -> list[dict[str, Any]]:
         """
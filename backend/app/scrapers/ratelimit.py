@@ -0,0 +1,152 @@
+"""
+Per-host rate limiting and retry for scraper HTTP requests.
+
+Providers signal throttling with 429/503 and Retry-After, or ahead of time
+with X-RateLimit-Remaining/X-RateLimit-Reset. Requests to a host that is
+out of quota wait until its reset instead of failing the run, and transient
+5xx responses are retried with exponential backoff and jitter.
+"""
+import asyncio
+import logging
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Statuses worth retrying: throttling and transient upstream failures
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_ATTEMPTS = 5
+
+# Upper bound for any single wait, including server-requested ones, so one
+# provider cannot stall a crawl indefinitely
+MAX_DELAY_SECONDS = 60.0
+
+# X-RateLimit-Reset values above this are epoch timestamps, not deltas
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_reset(value: Optional[str]) -> Optional[float]:
+    """Parse X-RateLimit-Reset (epoch seconds or delta seconds) into seconds."""
+    if not value:
+        return None
+    try:
+        reset = float(value)
+    except ValueError:
+        return None
+    if reset > _EPOCH_THRESHOLD:
+        reset -= time.time()
+    return max(reset, 0.0)
+
+
+class HostRateLimiter:
+    """
+    Tracks when each host may be called again.
+
+    Holds a monotonic resume time per host rather than asyncio primitives,
+    so one instance works across the fresh event loops Celery tasks run in.
+    """
+
+    def __init__(self):
+        """Initialize limiter with no hosts blocked."""
+        self._resume_at: dict[str, float] = {}
+
+    async def wait(self, host: str) -> None:
+        """Sleep until host is no longer blocked, including blocks extended meanwhile."""
+        while (resume_at := self._resume_at.get(host)) is not None:
+            delay = resume_at - time.monotonic()
+            if delay <= 0:
+                self._resume_at.pop(host, None)
+                return
+            await asyncio.sleep(delay)
+
+    def block(self, host: str, seconds: float) -> None:
+        """Hold new requests to host for seconds (capped at MAX_DELAY_SECONDS)."""
+        resume_at = time.monotonic() + min(seconds, MAX_DELAY_SECONDS)
+        if resume_at > self._resume_at.get(host, 0.0):
+            self._resume_at[host] = resume_at
+
+    def update(self, host: str, response: httpx.Response) -> None:
+        """
+        Apply rate-limit headers from a response.
+
+        Args:
+            host: Host the response came from
+            response: Response to read X-RateLimit-* headers from
+        """
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            reset = _parse_reset(response.headers.get("X-RateLimit-Reset"))
+            if reset:
+                logger.info(f"Rate limit exhausted for {host}, waiting {reset:.1f}s")
+                self.block(host, reset)
+
+
+host_rate_limiter = HostRateLimiter()
+
+
+async def send_with_retry(
+    client: httpx.AsyncClient,
+    request: httpx.Request,
+    stream: bool = False,
+) -> httpx.Response:
+    """
+    Send a request, honoring per-host rate limits and retrying transient errors.
+
+    429 and 503 wait for Retry-After when given; otherwise retries back off
+    exponentially (1, 2, 4, 8 seconds) plus up to a second of jitter. The
+    final response is returned whatever its status, so callers still call
+    raise_for_status().
+
+    Args:
+        client: HTTP client
+        request: Request built with client.build_request()
+        stream: Return without reading the body; the caller must close it
+
+    Returns:
+        Response from the last attempt
+    """
+    host = urlsplit(str(request.url)).hostname or ""
+
+    attempt = 0
+    while True:
+        await host_rate_limiter.wait(host)
+        response = await client.send(request, stream=stream)
+        host_rate_limiter.update(host, response)
+
+        if response.status_code not in RETRY_STATUSES or attempt == MAX_ATTEMPTS - 1:
+            return response
+
+        await response.aclose()
+
+        delay = _parse_retry_after(response.headers.get("Retry-After"))
+        if delay is not None:
+            # Server-requested wait applies to every request to the host
+            host_rate_limiter.block(host, delay)
+        else:
+            delay = 2 ** attempt + random.uniform(0, 1)
+        delay = min(delay, MAX_DELAY_SECONDS)
+
+        logger.warning(
+            f"HTTP {response.status_code} from {host}, retrying in {delay:.1f}s "
+            f"(attempt {attempt + 1}/{MAX_ATTEMPTS})"
+        )
+        await asyncio.sleep(delay)
+        attempt += 1
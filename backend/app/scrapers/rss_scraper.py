@@ -6,11 +6,11 @@ from datetime import datetime
 from typing import Any
 
 import feedparser
-import httpx
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.provider import Provider
 from app.scrapers.base import BaseScraper
+from app.scrapers.ratelimit import send_with_retry
 
 logger = logging.getLogger(__name__)
 
@@ -41,10 +41,12 @@ class RSSScraper(BaseScraper):
 
         logger.info(f"Fetching RSS feed from {self.provider.data_source_url}")
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(self.provider.data_source_url)
-            response.raise_for_status()
-            return response.text
+        client = await self.get_client()
+        response = await send_with_retry(
+            client, client.build_request("GET", self.provider.data_source_url)
+        )
+        response.raise_for_status()
+        return response.text
 
     async def parse_data(self, raw_data: str) -> list[dict[str, Any]]:
         """
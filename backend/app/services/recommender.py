@@ -8,13 +8,15 @@ from datetime import datetime
 from typing import Any
 
 from ortools.sat.python import cp_model
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.models.activity import Activity
 from app.models.child import ChildProfile
 from app.models.family import Family
 from app.models.recommendation import Recommendation
+from app.models.venue import Venue
 from app.services.scoring import ScoringEngine
 
 logger = logging.getLogger(__name__)
@@ -56,25 +58,20 @@ class RecommendationService:
         Returns:
             List of recommendations ordered by score
         """
-        # Get child and family
-        result = await self.db.execute(
-            select(ChildProfile).where(ChildProfile.id == child_profile_id)
-        )
-        child = result.scalar_one_or_none()
+        # Get child and family (identity map hits when the caller already
+        # loaded them, e.g. via verify_child_access)
+        child = await self.db.get(ChildProfile, child_profile_id)
 
         if not child:
             raise ValueError(f"Child profile {child_profile_id} not found")
 
-        result = await self.db.execute(
-            select(Family).where(Family.id == child.family_id)
-        )
-        family = result.scalar_one_or_none()
+        family = await self.db.get(Family, child.family_id)
 
         if not family:
             raise ValueError(f"Family {child.family_id} not found")
 
         # Get candidate activities
-        activities = await self._get_candidate_activities(child)
+        activities = await self._get_candidate_activities(child, family)
 
         if not activities:
             logger.warning(f"No candidate activities found for child {child_profile_id}")
@@ -149,7 +146,11 @@ class RecommendationService:
 
         return recommendations
 
-    async def _get_candidate_activities(self, child: ChildProfile) -> list[Activity]:
+    async def _get_candidate_activities(
+        self,
+        child: ChildProfile,
+        family: Family,
+    ) -> list[Activity]:
         """
         Get candidate activities for a child.
 
@@ -157,9 +158,12 @@ class RecommendationService:
         - Age range
         - Active status
         - Has valid start date
+        - Venue within the search radius of the family (if the family has a
+          location; activities without a venue are kept)
 
         Args:
             child: Child profile
+            family: Family profile
 
         Returns:
             List of candidate activities
@@ -182,6 +186,26 @@ class RecommendationService:
             (Activity.start_date.isnot(None)) | (Activity.rrule.isnot(None))
         )
 
+        # Distance filter, evaluated in SQL so the venues location index can
+        # serve it. The family point is read by subquery rather than bound
+        # from the loaded WKB element.
+        if family.location is not None:
+            family_location = (
+                select(Family.location)
+                .where(Family.id == family.id)
+                .scalar_subquery()
+            )
+            nearby_venue_ids = select(Venue.id).where(
+                func.ST_DWithin(
+                    Venue.location,
+                    family_location,
+                    settings.default_search_radius_km * 1000,
+                )
+            )
+            query = query.where(
+                Activity.venue_id.is_(None) | Activity.venue_id.in_(nearby_venue_ids)
+            )
+
         # Limit to top 50 for performance
         query = query.limit(50)
 
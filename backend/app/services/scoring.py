@@ -24,6 +24,21 @@ class ScoringEngine:
     3. Goals Score (20%): Alignment with child's goals
     """
 
+    # Simple goal mapping (to be replaced with proper taxonomy).
+    # TODO: Implement proper goal-to-activity-type mapping
+    GOAL_ACTIVITY_TYPES: dict[str, tuple[str, ...]] = {
+        "Build Confidence": ("arts", "music", "theatre", "martial_arts"),
+        "College Prep Skills": ("stem", "academic", "robotics", "coding"),
+        "Physical Fitness": ("sports", "swimming", "dance", "martial_arts"),
+        "Creative Expression": ("arts", "music", "theatre", "crafts"),
+        "Social Skills": ("team_sports", "scouts", "group_activities"),
+        "STEM Learning": ("stem", "robotics", "coding", "science"),
+        "Language Development": ("language", "reading", "debate", "theatre"),
+        "Cultural Connection": ("cultural", "language", "music", "dance"),
+        "Emotional Regulation": ("mindfulness", "yoga", "martial_arts", "nature"),
+        "Leadership": ("scouts", "team_captain", "student_government"),
+    }
+
     def __init__(self, child_profile: ChildProfile, family: Family):
         """
         Initialize scoring engine.
@@ -34,6 +49,16 @@ class ScoringEngine:
         """
         self.child = child_profile
         self.family = family
+        # Child-side inputs are fixed for a scoring run, so unpack the age and
+        # the JSONB temperament/constraints once instead of per activity
+        self.child_age = child_profile.age
+        temperament = child_profile.temperament or {}
+        self.has_temperament = bool(temperament)
+        self.child_intensity = temperament.get("intensity_preference", "moderate")
+        self.child_sensitivity = temperament.get("sensory_sensitivity", "medium")
+        self.child_social_preference = temperament.get("social_preference", "small_group")
+        constraints = child_profile.constraints or {}
+        self.has_neurodiversity_notes = bool(constraints.get("neurodiversity_notes"))
 
     def calculate_total_score(
         self,
@@ -197,7 +222,7 @@ class ScoringEngine:
 
     def _score_age_match(self, activity: Activity) -> float:
         """Score age band match (0-15 points)."""
-        child_age = self.child.age
+        child_age = self.child_age
 
         # Perfect match: age is within activity's range
         if activity.min_age and activity.max_age:
@@ -223,10 +248,10 @@ class ScoringEngine:
 
     def _score_intensity_match(self, activity: Activity) -> float:
         """Score intensity level match (0-10 points)."""
-        if not self.child.temperament:
+        if not self.has_temperament:
             return 5.0  # Neutral if no temperament data
 
-        child_intensity = self.child.temperament.get("intensity_preference", "moderate")
+        child_intensity = self.child_intensity
         activity_intensity = activity.attributes.get("intensity_level", "moderate") if activity.attributes else "moderate"
 
         # Perfect match
@@ -249,10 +274,10 @@ class ScoringEngine:
 
     def _score_sensory_match(self, activity: Activity) -> float:
         """Score sensory load match (0-10 points)."""
-        if not self.child.temperament:
+        if not self.has_temperament:
             return 5.0
 
-        child_sensitivity = self.child.temperament.get("sensory_sensitivity", "medium")
+        child_sensitivity = self.child_sensitivity
         activity_sensory = activity.attributes.get("sensory_load", "medium") if activity.attributes else "medium"
 
         # High sensitivity child needs low sensory load
@@ -275,10 +300,10 @@ class ScoringEngine:
 
     def _score_social_preference(self, activity: Activity) -> float:
         """Score social environment match (0-5 points)."""
-        if not self.child.temperament:
+        if not self.has_temperament:
             return 2.5
 
-        child_pref = self.child.temperament.get("social_preference", "small_group")
+        child_pref = self.child_social_preference
         activity_type = activity.attributes.get("team_vs_solo", "small_group") if activity.attributes else "small_group"
 
         if child_pref == activity_type:
@@ -294,13 +319,8 @@ class ScoringEngine:
 
     def _score_neurodiversity(self, activity: Activity) -> float:
         """Score neurodiversity considerations (0-5 points)."""
-        if not self.child.constraints:
-            return 5.0
-
-        neurodiversity_notes = self.child.constraints.get("neurodiversity_notes", "")
-
         # If child has neurodiversity notes, prefer neurodiversity-friendly activities
-        if neurodiversity_notes:
+        if self.has_neurodiversity_notes:
             is_neuro_friendly = activity.attributes.get("neurodiversity_friendly", False) if activity.attributes else False
             if is_neuro_friendly:
                 return 5.0
@@ -358,30 +378,13 @@ class ScoringEngine:
         if not goal:
             return 0.0
 
-        # TODO: Implement proper goal-to-activity-type mapping
-        # For now, use simple heuristics
-
-        activity_type = activity.activity_type or ""
-
-        # Simple goal mapping (to be replaced with proper taxonomy)
-        goal_mappings = {
-            "Build Confidence": ["arts", "music", "theatre", "martial_arts"],
-            "College Prep Skills": ["stem", "academic", "robotics", "coding"],
-            "Physical Fitness": ["sports", "swimming", "dance", "martial_arts"],
-            "Creative Expression": ["arts", "music", "theatre", "crafts"],
-            "Social Skills": ["team_sports", "scouts", "group_activities"],
-            "STEM Learning": ["stem", "robotics", "coding", "science"],
-            "Language Development": ["language", "reading", "debate", "theatre"],
-            "Cultural Connection": ["cultural", "language", "music", "dance"],
-            "Emotional Regulation": ["mindfulness", "yoga", "martial_arts", "nature"],
-            "Leadership": ["scouts", "team_captain", "student_government"],
-        }
+        activity_type = (activity.activity_type or "").lower()
 
-        aligned_types = goal_mappings.get(goal, [])
+        aligned_types = self.GOAL_ACTIVITY_TYPES.get(goal, ())
 
         # Check if activity type matches goal
         for aligned_type in aligned_types:
-            if aligned_type in activity_type.lower():
+            if aligned_type in activity_type:
                 return max_points
 
         # Partial match
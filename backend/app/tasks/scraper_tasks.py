@@ -5,12 +5,18 @@ Celery tasks must be synchronous functions. These tasks wrap async scraper funct
 """
 import asyncio
 import logging
+from collections.abc import Awaitable
+from contextlib import AsyncExitStack
 from typing import Any, Optional
 
 from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.db.base import AsyncSessionLocal
 from app.models.provider import Provider
+from app.models.scraper_log import ScraperLog
+from app.scrapers.base import BaseScraper
 from app.scrapers.csv_scraper import CSVScraper
 from app.scrapers.html_scraper import HTMLScraper
 from app.scrapers.ics_scraper import ICScraper
@@ -21,6 +27,94 @@ from app.services.provider_config import ProviderConfigLoader
 logger = logging.getLogger(__name__)
 
 
+def _load_scraper_config(provider: Provider) -> dict[str, Any]:
+    """
+    Load a provider's scraper_config from the providers YAML.
+
+    Args:
+        provider: Provider to look up by name
+
+    Returns:
+        scraper_config dict (empty if the provider is not configured)
+    """
+    try:
+        loader = ProviderConfigLoader()
+        providers_config = loader.get_providers(enabled_only=False)
+        provider_config = next(
+            (p for p in providers_config if p["name"] == provider.name),
+            None
+        )
+        if provider_config:
+            # Resolve env vars and get scraper_config
+            provider_config = loader.resolve_env_vars(provider_config)
+            return provider_config.get("scraper_config", {})
+    except Exception as e:
+        logger.warning(f"Could not load scraper_config from YAML: {str(e)}")
+    return {}
+
+
+def _build_scraper(
+    db: AsyncSession,
+    provider: Provider,
+    scraper_config: Optional[dict[str, Any]],
+) -> BaseScraper:
+    """
+    Create the scraper for a provider's data_source_type.
+
+    Args:
+        db: Database session the scraper will write to
+        provider: Provider to scrape
+        scraper_config: Scraper configuration (e.g., table_selector for HTML)
+
+    Returns:
+        Scraper instance
+
+    Raises:
+        ValueError: If the provider has no or an unknown data_source_type
+    """
+    scraper_type = provider.data_source_type
+
+    if not scraper_type:
+        raise ValueError("No scraper type configured")
+
+    if scraper_type == "ics":
+        return ICScraper(db, provider)
+    if scraper_type == "rss":
+        return RSSScraper(db, provider)
+    if scraper_type == "html":
+        table_selector = scraper_config.get("table_selector", "table") if scraper_config else "table"
+        return HTMLScraper(db, provider, table_selector=table_selector)
+    if scraper_type == "json":
+        json_path = scraper_config.get("json_path") if scraper_config else None
+        api_key = scraper_config.get("api_key") if scraper_config else None
+        return JSONScraper(db, provider, json_path=json_path, api_key=api_key)
+    if scraper_type == "csv":
+        encoding = scraper_config.get("encoding", "utf-8") if scraper_config else "utf-8"
+        delimiter = scraper_config.get("delimiter", ",") if scraper_config else ","
+        return CSVScraper(db, provider, encoding=encoding, delimiter=delimiter)
+
+    raise ValueError(f"Unknown scraper type: {scraper_type}")
+
+
+def _log_result(provider: Provider, log: ScraperLog) -> dict[str, Any]:
+    """Summarize a finished run for the task result."""
+    logger.info(
+        f"Scraper task completed: provider={provider.name}, "
+        f"status={log.status}, pass_rate={log.pass_rate}"
+    )
+
+    return {
+        "provider_id": provider.id,
+        "provider_name": provider.name,
+        "status": log.status,
+        "activities_found": log.activities_found,
+        "activities_passed": log.activities_passed,
+        "activities_failed": log.activities_failed,
+        "duplicates_found": log.duplicates_found,
+        "pass_rate": log.pass_rate,
+    }
+
+
 async def _scrape_provider_async(provider_id: int, scraper_config: Optional[dict[str, Any]] = None) -> dict[str, Any]:
     """
     Scrape a single provider.
@@ -45,70 +139,20 @@ async def _scrape_provider_async(provider_id: int, scraper_config: Optional[dict
             logger.error(f"Provider {provider_id} not found")
             return {"error": "Provider not found"}
 
-        # Determine scraper type
-        scraper_type = provider.data_source_type
-
-        if not scraper_type:
-            logger.error(f"Provider {provider.name} has no data_source_type")
-            return {"error": "No scraper type configured"}
-
         # Load scraper_config from YAML if not provided
         if scraper_config is None:
-            try:
-                loader = ProviderConfigLoader()
-                providers_config = loader.get_providers(enabled_only=False)
-                provider_config = next(
-                    (p for p in providers_config if p["name"] == provider.name),
-                    None
-                )
-                if provider_config:
-                    # Resolve env vars and get scraper_config
-                    provider_config = loader.resolve_env_vars(provider_config)
-                    scraper_config = provider_config.get("scraper_config", {})
-            except Exception as e:
-                logger.warning(f"Could not load scraper_config from YAML: {str(e)}")
-                scraper_config = {}
-
-        # Create appropriate scraper
-        scraper = None
+            scraper_config = _load_scraper_config(provider)
+
         try:
-            if scraper_type == "ics":
-                scraper = ICScraper(db, provider)
-            elif scraper_type == "rss":
-                scraper = RSSScraper(db, provider)
-            elif scraper_type == "html":
-                table_selector = scraper_config.get("table_selector", "table") if scraper_config else "table"
-                scraper = HTMLScraper(db, provider, table_selector=table_selector)
-            elif scraper_type == "json":
-                json_path = scraper_config.get("json_path") if scraper_config else None
-                api_key = scraper_config.get("api_key") if scraper_config else None
-                scraper = JSONScraper(db, provider, json_path=json_path, api_key=api_key)
-            elif scraper_type == "csv":
-                encoding = scraper_config.get("encoding", "utf-8") if scraper_config else "utf-8"
-                delimiter = scraper_config.get("delimiter", ",") if scraper_config else ","
-                scraper = CSVScraper(db, provider, encoding=encoding, delimiter=delimiter)
-            else:
-                logger.error(f"Unknown scraper type: {scraper_type}")
-                return {"error": f"Unknown scraper type: {scraper_type}"}
+            scraper = _build_scraper(db, provider, scraper_config)
+        except ValueError as e:
+            logger.error(f"Provider {provider.name}: {str(e)}")
+            return {"error": str(e)}
 
+        try:
             # Run scraper
             log = await scraper.run()
-
-            logger.info(
-                f"Scraper task completed: provider={provider.name}, "
-                f"status={log.status}, pass_rate={log.pass_rate}"
-            )
-
-            return {
-                "provider_id": provider_id,
-                "provider_name": provider.name,
-                "status": log.status,
-                "activities_found": log.activities_found,
-                "activities_passed": log.activities_passed,
-                "activities_failed": log.activities_failed,
-                "duplicates_found": log.duplicates_found,
-                "pass_rate": log.pass_rate,
-            }
+            return _log_result(provider, log)
 
         except Exception as e:
             logger.error(f"Scraper task failed: {str(e)}", exc_info=True)
@@ -122,11 +166,16 @@ async def _scrape_all_providers_async() -> dict[str, Any]:
     """
     Scrape all active providers.
 
+    Providers are scraped concurrently (see BaseScraper.run_many), each on
+    its own session since a session cannot be shared between tasks.
+
     Returns:
         Dictionary with overall results
     """
     logger.info("Starting scrape_all_providers task")
 
+    # Load providers on a short-lived session so its connection goes back to
+    # the pool before the scrapers start
     async with AsyncSessionLocal() as db:
         # Get all providers with data sources
         result = await db.execute(
@@ -134,42 +183,82 @@ async def _scrape_all_providers_async() -> dict[str, Any]:
         )
         providers = result.scalars().all()
 
-        logger.info(f"Found {len(providers)} providers to scrape")
+    logger.info(f"Found {len(providers)} providers to scrape")
 
-        results = []
+    results = []
+    async with AsyncExitStack() as sessions:
+        scrapers = []
         for provider in providers:
+            # Sessions only take a connection once a run starts saving
+            session = await sessions.enter_async_context(AsyncSessionLocal())
             try:
-                result = await _scrape_provider_async(provider.id)
-                results.append(result)
-            except Exception as e:
-                logger.error(
-                    f"Failed to scrape provider {provider.name}: {str(e)}",
-                    exc_info=True,
+                scrapers.append(
+                    _build_scraper(session, provider, _load_scraper_config(provider))
                 )
+            except ValueError as e:
+                logger.error(f"Failed to scrape provider {provider.name}: {str(e)}")
                 results.append({
                     "provider_id": provider.id,
                     "provider_name": provider.name,
                     "error": str(e),
                 })
 
-        # Summary
-        total_providers = len(results)
-        successful = sum(1 for r in results if r.get("status") == "success")
-        partial = sum(1 for r in results if r.get("status") == "partial")
-        failed = sum(1 for r in results if r.get("error") or r.get("status") == "failed")
+        # Never run more scrapers at once than the pool has connections for
+        total_limit = 64
+        if not settings.database_pgbouncer:
+            total_limit = min(
+                total_limit,
+                settings.database_pool_size + settings.database_max_overflow,
+            )
+        logs = await BaseScraper.run_many(scrapers, total_limit=total_limit)
 
-        logger.info(
-            f"scrape_all_providers completed: total={total_providers}, "
-            f"successful={successful}, partial={partial}, failed={failed}"
-        )
+    for scraper, log in zip(scrapers, logs):
+        if isinstance(log, BaseException):
+            logger.error(
+                f"Failed to scrape provider {scraper.provider.name}: {str(log)}",
+                exc_info=log,
+            )
+            results.append({
+                "provider_id": scraper.provider.id,
+                "provider_name": scraper.provider.name,
+                "error": str(log),
+            })
+        else:
+            results.append(_log_result(scraper.provider, log))
 
-        return {
-            "total_providers": total_providers,
-            "successful": successful,
-            "partial": partial,
-            "failed": failed,
-            "results": results,
-        }
+    # Summary
+    total_providers = len(results)
+    successful = sum(1 for r in results if r.get("status") == "success")
+    partial = sum(1 for r in results if r.get("status") == "partial")
+    failed = sum(1 for r in results if r.get("error") or r.get("status") == "failed")
+
+    logger.info(
+        f"scrape_all_providers completed: total={total_providers}, "
+        f"successful={successful}, partial={partial}, failed={failed}"
+    )
+
+    # One windowed query over the latest runs of every provider
+    async with AsyncSessionLocal() as db:
+        demote_provider_ids = await ScraperLog.providers_to_demote(db)
+    if demote_provider_ids:
+        logger.warning(f"Providers to demote: {demote_provider_ids}")
+
+    return {
+        "total_providers": total_providers,
+        "successful": successful,
+        "partial": partial,
+        "failed": failed,
+        "demote_provider_ids": demote_provider_ids,
+        "results": results,
+    }
+
+
+async def _close_client_after(coro: Awaitable[dict[str, Any]]) -> dict[str, Any]:
+    """Await a scrape, then close the shared HTTP client before its event loop ends."""
+    try:
+        return await coro
+    finally:
+        await BaseScraper.close_client()
 
 
 # Sync wrapper functions for Celery (Celery tasks must be synchronous)
@@ -189,7 +278,9 @@ def scrape_provider_task(provider_id: int, scraper_config: Optional[dict[str, An
     """
     try:
         # Use asyncio.run() which creates a new event loop and runs until complete
-        return asyncio.run(_scrape_provider_async(provider_id, scraper_config))
+        return asyncio.run(
+            _close_client_after(_scrape_provider_async(provider_id, scraper_config))
+        )
     except Exception as e:
         logger.error(f"Error in scrape_provider_task wrapper: {str(e)}", exc_info=True)
         return {
@@ -210,7 +301,7 @@ def scrape_all_providers_task() -> dict[str, Any]:
     """
     try:
         # Use asyncio.run() which creates a new event loop and runs until complete
-        return asyncio.run(_scrape_all_providers_async())
+        return asyncio.run(_close_client_after(_scrape_all_providers_async()))
     except Exception as e:
         logger.error(f"Error in scrape_all_providers_task wrapper: {str(e)}", exc_info=True)
         return {
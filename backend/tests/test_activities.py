@@ -0,0 +1,62 @@
+"""
+Tests for activity catalog endpoints (conditional requests).
+"""
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from fastapi import Request
+
+from app.api.endpoints.activities import list_activities
+from app.schemas.activity import ActivityResponse
+
+
+def _request(if_none_match: str = None) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "headers": headers})
+
+
+def _list(db: MagicMock, request: Request):
+    return asyncio.run(
+        list_activities(
+            db=db,
+            request=request,
+            after_id=None,
+            limit=2,
+            activity_type=None,
+            min_age=None,
+            max_age=None,
+            is_active=True,
+        )
+    )
+
+
+def test_list_activities_etag_without_probe_matches_probe():
+    """Cold requests skip the probe query but send the ETag the probe would match."""
+    older = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    newer = datetime(2025, 2, 1, tzinfo=timezone.utc)
+    rows = [SimpleNamespace(id=3, updated_at=newer), SimpleNamespace(id=7, updated_at=older)]
+
+    page = MagicMock()
+    page.scalars.return_value.all.return_value = rows
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=page)
+
+    with patch.object(ActivityResponse, "encode_trusted", return_value=b"[]"):
+        response = _list(db, _request())
+
+    assert db.execute.await_count == 1
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    probe = MagicMock()
+    probe.one.return_value = (newer, 2, 7)
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=probe)
+
+    response = _list(db, _request(etag))
+
+    assert db.execute.await_count == 1
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
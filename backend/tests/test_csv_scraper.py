@@ -0,0 +1,77 @@
+"""
+Tests for streamed CSV parsing.
+"""
+import asyncio
+import time
+from datetime import date
+from unittest.mock import MagicMock
+
+from app.models.provider import Provider
+from app.scrapers.csv_scraper import CSVScraper, _RecordSplitter
+
+
+CSV_DATA = (
+    "Title,Date,Description\r\n"
+    'Pizza party,2025-01-05,Bring a 12" pie\r\n'
+    'Art class,2025-01-06,"Two lines:\r\nbring ""old"" clothes"\r\n'
+    "Swim,01/07/2025,Pool\r\n"
+    "Last,2025-01-08,No trailing newline"
+)
+
+
+def _make_scraper() -> CSVScraper:
+    provider = Provider(
+        id=1,
+        name="City Recreation",
+        organization_type="city_rec",
+        data_source_url="https://example.com/activities.csv",
+    )
+    return CSVScraper(MagicMock(), provider)
+
+
+async def _chunks(text: str, size: int):
+    for i in range(0, len(text), size):
+        yield text[i:i + size]
+
+
+def test_parse_data_stray_quote_and_multiline_field():
+    """Stray quotes stay literal and quoted newlines stay in their field, for any chunking."""
+    for size in (1, 2, 7, 64, len(CSV_DATA)):
+        scraper = _make_scraper()
+        activities = asyncio.run(scraper.parse_data(_chunks(CSV_DATA, size)))
+
+        assert [(a["name"], a["description"], a["start_date"]) for a in activities] == [
+            ("Pizza party", 'Bring a 12" pie', date(2025, 1, 5)),
+            ("Art class", 'Two lines:\r\nbring "old" clothes', date(2025, 1, 6)),
+            ("Swim", "Pool", date(2025, 1, 7)),
+            ("Last", "No trailing newline", date(2025, 1, 8)),
+        ], size
+        assert scraper.errors == []
+
+
+def test_record_splitter_does_not_hold_back_after_stray_quote():
+    """A stray quote does not buffer the rest of the feed; a quoted newline does."""
+    splitter = _RecordSplitter(",")
+
+    assert splitter.push('Pizza party,12" pie\n') == ['Pizza party,12" pie\n']
+    assert splitter.push('Art,"line one\n') == []
+    assert splitter.push('line two"\nSwim,Pool\n') == [
+        'Art,"line one\n',
+        'line two"\n',
+        "Swim,Pool\n",
+    ]
+    assert splitter.push("Tail") == []
+    assert splitter.flush() == ["Tail"]
+
+
+def test_parse_data_stray_quote_scales_linearly():
+    """A large feed with a stray quote near the top parses in small chunks without stalling."""
+    rows = "".join(f"Activity {i},2025-01-05,Plain row\n" for i in range(20000))
+    data = 'Title,Date,Description\nPizza,2025-01-05,12" pie\n' + rows
+
+    scraper = _make_scraper()
+    started = time.perf_counter()
+    activities = asyncio.run(scraper.parse_data(_chunks(data, 4096)))
+
+    assert len(activities) == 20001
+    assert time.perf_counter() - started < 10
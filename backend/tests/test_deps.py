@@ -0,0 +1,97 @@
+"""
+Tests for FastAPI dependencies (current user resolution).
+"""
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.core.deps import UserFlags, get_current_user, get_current_user_flags
+from app.core.security import create_access_token
+from app.models.user import User
+
+
+def _mock_db(user: User) -> MagicMock:
+    """Create a mock session whose execute() returns the given user."""
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = user
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=result)
+    return db
+
+
+def test_get_current_user_caches_lookup_per_token():
+    """Repeated requests with the same token hit the database once."""
+    now = datetime.now(timezone.utc)
+    user = User(
+        id=321,
+        email="cached@example.com",
+        hashed_password="x",
+        is_active=True,
+        is_superuser=False,
+        created_at=now,
+        updated_at=now,
+    )
+    db = _mock_db(user)
+    credentials = HTTPAuthorizationCredentials(
+        scheme="Bearer",
+        credentials=create_access_token(subject=user.id),
+    )
+
+    with patch("app.core.deps.user_flags_cache") as flags_cache:
+        flags_cache.get = AsyncMock(return_value=None)
+        flags_cache.set = AsyncMock()
+        first = asyncio.run(get_current_user(credentials, db))
+        second = asyncio.run(get_current_user(credentials, db))
+
+    flags_cache.set.assert_awaited_once_with(321, True, False)
+
+    assert db.execute.await_count == 1
+    assert first.email == second.email == "cached@example.com"
+    # Each request gets its own instance
+    assert first is not second
+
+
+def test_get_current_user_flags_uses_shared_cache():
+    """A Redis hit on the user's flags skips the database."""
+    db = _mock_db(None)
+
+    with patch("app.core.deps.user_flags_cache") as flags_cache:
+        flags_cache.get = AsyncMock(
+            return_value={"is_active": True, "is_superuser": False}
+        )
+        flags = asyncio.run(get_current_user_flags({"sub": "654"}, db))
+
+    db.execute.assert_not_awaited()
+    assert flags == UserFlags(id=654, is_active=True, is_superuser=False)
+
+
+def test_get_current_user_ignores_shared_flags_cache():
+    """get_current_user returns a fully loaded User, never a flags-only stub."""
+    now = datetime.now(timezone.utc)
+    user = User(
+        id=655,
+        email="full@example.com",
+        hashed_password="x",
+        is_active=True,
+        is_superuser=False,
+        created_at=now,
+        updated_at=now,
+    )
+    db = _mock_db(user)
+    credentials = HTTPAuthorizationCredentials(
+        scheme="Bearer",
+        credentials=create_access_token(subject=user.id),
+    )
+
+    with patch("app.core.deps.user_flags_cache") as flags_cache:
+        flags_cache.get = AsyncMock(
+            return_value={"is_active": True, "is_superuser": False}
+        )
+        flags_cache.set = AsyncMock()
+        loaded = asyncio.run(get_current_user(credentials, db))
+
+    flags_cache.get.assert_not_awaited()
+    assert db.execute.await_count == 1
+    assert loaded.email == "full@example.com"
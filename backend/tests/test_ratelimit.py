@@ -0,0 +1,164 @@
+"""
+Tests for per-host rate limiting and HTTP retry.
+"""
+import asyncio
+import time
+from email.utils import formatdate
+from unittest.mock import MagicMock, patch
+
+import httpx
+
+from app.scrapers import ratelimit
+from app.scrapers.ratelimit import (
+    HostRateLimiter,
+    _parse_reset,
+    _parse_retry_after,
+    send_with_retry,
+)
+
+URL = "https://provider.example/activities.csv"
+HOST = "provider.example"
+
+
+class FakeClock:
+    """Stands in for the time module and asyncio.sleep so waits take no real time."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+        self.on_sleep = None
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return 1_700_000_000.0 + self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        self.now += delay
+        if self.on_sleep:
+            self.on_sleep()
+
+
+def _patched(clock: FakeClock, limiter: HostRateLimiter):
+    """Patch ratelimit's clock, sleep and shared limiter for one test."""
+    fake_asyncio = MagicMock()
+    fake_asyncio.sleep = clock.sleep
+    return (
+        patch.object(ratelimit, "time", clock),
+        patch.object(ratelimit, "asyncio", fake_asyncio),
+        patch.object(ratelimit, "host_rate_limiter", limiter),
+    )
+
+
+def _run(clock: FakeClock, limiter: HostRateLimiter, coro_fn):
+    time_patch, asyncio_patch, limiter_patch = _patched(clock, limiter)
+    with time_patch, asyncio_patch, limiter_patch:
+        return asyncio.run(coro_fn())
+
+
+def _send(handler, count: int = 1) -> list[httpx.Response]:
+    async def go():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return [
+                await send_with_retry(client, client.build_request("GET", URL))
+                for _ in range(count)
+            ]
+    return go
+
+
+def test_parse_retry_after():
+    """Retry-After accepts delta seconds and HTTP-dates and ignores junk."""
+    assert _parse_retry_after("7") == 7.0
+    assert _parse_retry_after("-3") == 0.0
+    assert _parse_retry_after(None) is None
+    assert _parse_retry_after("soon") is None
+
+    delay = _parse_retry_after(formatdate(time.time() + 30, usegmt=True))
+    assert 28 <= delay <= 30
+
+
+def test_parse_reset():
+    """X-RateLimit-Reset accepts delta seconds and epoch timestamps."""
+    assert _parse_reset("12") == 12.0
+    assert _parse_reset("") is None
+    assert _parse_reset("later") is None
+
+    delay = _parse_reset(str(int(time.time()) + 30))
+    assert 28 <= delay <= 30
+
+
+def test_send_with_retry_honors_retry_after_on_429():
+    """A 429 with Retry-After waits exactly that long, then retries."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(429, headers={"Retry-After": "7"})
+        return httpx.Response(200, text="ok")
+
+    clock = FakeClock()
+    [response] = _run(clock, HostRateLimiter(), _send(handler))
+
+    assert response.status_code == 200
+    assert len(calls) == 2
+    assert clock.sleeps == [7.0]
+
+
+def test_send_with_retry_backs_off_on_5xx():
+    """5xx without Retry-After backs off exponentially, returning the last response."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(503)
+
+    clock = FakeClock()
+    [response] = _run(clock, HostRateLimiter(), _send(handler))
+
+    assert response.status_code == 503
+    assert len(calls) == ratelimit.MAX_ATTEMPTS
+    assert len(clock.sleeps) == ratelimit.MAX_ATTEMPTS - 1
+    for attempt, delay in enumerate(clock.sleeps):
+        assert 2 ** attempt <= delay <= 2 ** attempt + 1
+
+
+def test_send_with_retry_waits_when_quota_exhausted():
+    """X-RateLimit-Remaining: 0 holds the next request to the host until reset."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(
+            200,
+            headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "12"},
+        )
+
+    clock = FakeClock()
+    responses = _run(clock, HostRateLimiter(), _send(handler, count=2))
+
+    assert [r.status_code for r in responses] == [200, 200]
+    assert len(calls) == 2
+    assert clock.sleeps == [12.0]
+
+
+def test_wait_rechecks_block_extended_while_sleeping():
+    """wait keeps sleeping when another request extends the block meanwhile."""
+    clock = FakeClock()
+    limiter = HostRateLimiter()
+
+    def extend_once():
+        if len(clock.sleeps) == 1:
+            limiter.block(HOST, 5)
+
+    clock.on_sleep = extend_once
+
+    async def go():
+        limiter.block(HOST, 10)
+        await limiter.wait(HOST)
+
+    _run(clock, limiter, go)
+
+    assert clock.sleeps == [10.0, 5.0]
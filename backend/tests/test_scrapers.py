@@ -11,6 +11,9 @@ from app.scrapers.base import BaseScraper
 class MockScraper(BaseScraper):
     """Mock scraper for testing base functionality."""
 
+    def __init__(self, db, provider):
+        super().__init__(db, provider, scraper_type="csv")
+
     async def fetch_data(self):
         return "mock_data"
 
@@ -77,6 +80,36 @@ def test_generate_canon_hash():
     assert hash1 == hash4
 
 
+def test_generate_canon_hashes_batch_matches_single():
+    """Batch hashing gives the same canon_hash as hashing each row on its own."""
+    db = MagicMock()
+    provider = Provider(
+        id=1,
+        name="City Recreation, Inc.",
+        organization_type="city_rec",
+    )
+
+    scraper = MockScraper(db, provider)
+
+    activities = [
+        {"name": "Soccer  Practice", "start_date": "2025-01-15", "geohash": "9q8yyzz"},
+        {"name": "Art Class", "start_date": None, "geohash": None},
+        {"name": "Swim"},
+    ]
+
+    expected = [
+        scraper.generate_canon_hash(
+            name=activity.get("name", ""),
+            start_date=str(activity.get("start_date", "")),
+            geohash=activity.get("geohash", ""),
+            org_name=provider.name,
+        )
+        for activity in activities
+    ]
+
+    assert scraper.generate_canon_hashes_batch(activities) == expected
+
+
 def test_validate_activity():
     """Test activity validation."""
     db = MagicMock()
@@ -56,3 +56,95 @@ def test_token_with_additional_claims():
     assert payload["sub"] == str(user_id)
     assert payload["email"] == "test@example.com"
     assert payload["role"] == "admin"
+
+
+def test_password_hash_uses_argon2id():
+    """New hashes use argon2id; legacy bcrypt hashes still verify."""
+    import bcrypt
+
+    hashed = get_password_hash("testpassword123")
+    assert hashed.startswith("$argon2id$")
+
+    legacy = bcrypt.hashpw(b"testpassword123", bcrypt.gensalt()).decode("utf-8")
+    assert verify_password("testpassword123", legacy)
+    assert not verify_password("wrongpassword", legacy)
+
+
+def test_decode_token_caches_valid_payloads():
+    """Repeat decodes are served from cache; invalid tokens still raise."""
+    from datetime import timedelta
+    from unittest.mock import patch
+
+    from jwt import InvalidTokenError
+
+    token = create_access_token(subject=321)
+    first = decode_token(token)
+    first["sub"] = "mutated"
+
+    with patch("app.core.security.jwt.decode") as jwt_decode:
+        second = decode_token(token)
+    jwt_decode.assert_not_called()
+    assert second["sub"] == "321"
+
+    expired = create_access_token(subject=321, expires_delta=timedelta(seconds=-1))
+    with pytest.raises(InvalidTokenError):
+        decode_token(expired)
+
+
+def test_password_needs_rehash():
+    """Legacy bcrypt hashes are flagged for migration; argon2id ones are not."""
+    import bcrypt
+
+    from app.core.security import password_needs_rehash
+
+    legacy = bcrypt.hashpw(b"testpassword123", bcrypt.gensalt()).decode("utf-8")
+    assert password_needs_rehash(legacy)
+    assert not password_needs_rehash(get_password_hash("testpassword123"))
+
+
+def test_async_password_helpers():
+    """Async wrappers hash and verify on the dedicated pool."""
+    import asyncio
+
+    from app.core.security import aget_password_hash, averify_password
+
+    hashed = asyncio.run(aget_password_hash("testpassword123"))
+    assert asyncio.run(averify_password("testpassword123", hashed))
+    assert not asyncio.run(averify_password("wrongpassword", hashed))
+
+
+def test_hs256_fast_path_matches_pyjwt():
+    """Tokens signed by the HS256 fast path are byte-identical to PyJWT's."""
+    import jwt
+
+    from app.core.security import _SECRET_KEY, _encode_token
+
+    claims = {"exp": 2_000_000_000, "sub": "42", "type": "access"}
+    assert _encode_token(claims) == jwt.encode(claims, _SECRET_KEY, algorithm="HS256")
+
+
+def test_decode_token_rejects_tampered_signature():
+    """The HS256 fast path rejects tokens whose signature doesn't match."""
+    from jwt import InvalidTokenError
+
+    token = create_access_token(subject=99)
+    header, payload, signature = token.split(".")
+    forged = create_access_token(subject=100).split(".")[1]
+
+    with pytest.raises(InvalidTokenError):
+        decode_token(f"{header}.{forged}.{signature}")
+
+
+def test_decode_token_leaves_non_int_exp_to_pyjwt():
+    """A float exp skips the fast path and is decoded by PyJWT instead of rejected."""
+    import time
+
+    import jwt
+
+    from app.core.security import _SECRET_KEY, _decode_hmac
+
+    claims = {"exp": time.time() + 600.5, "sub": "42", "type": "access"}
+    token = jwt.encode(claims, _SECRET_KEY, algorithm="HS256")
+
+    assert _decode_hmac(token) is None
+    assert decode_token(token)["sub"] == "42"